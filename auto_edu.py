@@ -29,7 +29,7 @@ Example:
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Date Created: 2025-08-20
-Last Modified: 2025-12-09
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
@@ -81,6 +81,12 @@ class AutoEdu:
                         class.
             - "progression": Placeholder for student progression logic.
             - "profile": Placeholder for student profile logic.
+            - "section_shift": Runs the section shift workflow via
+                               StudentSectionShift.
+
+        Returns:
+            Future or None: The section shift report export, still running
+                in the background; None for the other tasks.
         """
         if MODULE == "student":
             login = StudentLogin()
@@ -95,7 +101,7 @@ class AutoEdu:
                 pass
             elif TASK == "section_shift":
                 from portals.udise import StudentSectionShift
-                StudentSectionShift().start_section_shift()
+                return StudentSectionShift().start_section_shift()
         elif MODULE == "teacher":
             pass
 
@@ -131,15 +137,24 @@ if __name__ == "__main__":
         "education_portal3": auto_edu.portal_edu3,
     }
 
+    # Future for work a workflow leaves running, e.g. the report export;
+    # joined once the browser is closed
+    pending = None
     try:
         launch_browser(URL)
         MainPage.check_status()
-        portal_router[PORTAL]()
+        pending = portal_router[PORTAL]()
     except Exception as e:
         logger.exception("AutoEdu encountered an error: %s", str(e))
     finally:
         if not DEBUG:
             WebDriverManager.get_driver().quit()
+        if pending is not None:
+            try:
+                pending.result()
+            except Exception as e:
+                logger.exception("AutoEdu background task failed: %s",
+                                 str(e))
         logger.info(" *********** AutoEdu run completed in [%s] *********** ",
                     get_time_duration(start_time, datetime.now()))
         log_end()
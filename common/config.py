@@ -11,7 +11,7 @@ purposes.
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Date Created: 2025-08-18
-Last Modified: 2026-01-19
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 
@@ -40,6 +40,12 @@ Attributes:
     TIME_DELAY (float): Delay between UI actions in seconds. Default is 1.0.
     VERIFY_SSL (bool): Whether to verify SSL certificates. Default is True.
     RETRIES (int): Number of retry attempts for UI actions. Default is 3.
+    HEADLESS (bool): Run the browser without a visible window.
+                     Default is False.
+    BLOCK_IMAGES (bool): Skip loading images in the browser.
+                         Default is False.
+    PAGE_LOAD_STRATEGY (str): Selenium page load strategy ("normal",
+                              "eager" or "none"). Default is "normal".
 
     CLASS_AGE_MAP (dict): Mapping of class to expected age for YOB inference.
     MAX_YOB_TRIAL_RANGE (int): Maximum number of YOB trials allowed.
@@ -85,10 +91,19 @@ else:
     URL = _config.get("URL", {}).get(PORTAL, "default_url")
 
 # Options
-TIMEOUT = _config.get("OPTIONS", {}).get("timeout", 30)
-TIME_DELAY = float(_config.get("OPTIONS", {}).get("time_delay", 1))
-VERIFY_SSL = _config.get("OPTIONS", {}).get("verify_ssl", True)
-RETRIES = _config.get("OPTIONS", {}).get("retries", 3)
+_options = _config.get("OPTIONS", {})
+TIMEOUT = _options.get("timeout", 30)
+TIME_DELAY = float(_options.get("time_delay", 1))
+VERIFY_SSL = _options.get("verify_ssl", True)
+RETRIES = _options.get("retries", 3)
+# Both need the login CAPTCHA to be solvable without seeing the page,
+# so they are off unless explicitly enabled
+HEADLESS = _options.get("headless", False)
+BLOCK_IMAGES = _options.get("block_images", False)
+# "normal" waits for the full page load. "eager" returns once the DOM is
+# ready and is only safe for flows verified to wait explicitly for every
+# element they use
+PAGE_LOAD_STRATEGY = _options.get("page_load_strategy", "normal")
 
 CLASS_AGE_MAP = _config.get("CLASS_AGE_MAP")
 MAX_YOB_TRIAL_RANGE = _config.get("MAX_YOB_TRIAL_RANGE", 3)
@@ -127,4 +142,7 @@ def log_config(logger):
     logger.info("URL: %s", URL)
     logger.debug("TIMEOUT: %s", TIMEOUT)
     logger.debug("TIME_DELAY: %s", TIME_DELAY)
+    logger.debug("HEADLESS: %s", HEADLESS)
+    logger.debug("BLOCK_IMAGES: %s", BLOCK_IMAGES)
+    logger.debug("PAGE_LOAD_STRATEGY: %s", PAGE_LOAD_STRATEGY)
     logger.debug("HOLIDAY_MONTHS: %s", HOLIDAY_MONTHS)
@@ -7,13 +7,17 @@ reuse across modules.
 
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 Date Created: 2025-08-18
-Last Modified: 2025-10-15
+Last Modified: 2026-10-15
 Version: 2.0.0
 """
 
+import json
 import os
+import threading
+import time
 
 from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -21,20 +25,30 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
-from common.config import BROWSER, DEBUG
+from common.config import (BLOCK_IMAGES, BROWSER, DEBUG, HEADLESS,
+                           PAGE_LOAD_STRATEGY)
+
+# Driver paths resolved by webdriver-manager, keyed by browser
+DRIVER_PATH_CACHE = os.path.join(
+    os.path.expanduser("~"), ".cache", "autoedu", "driver_paths.json")
+# How long a cached driver path is trusted before checking for updates
+DRIVER_PATH_TTL = 7 * 24 * 60 * 60
 
 
 class WebDriverManager:
     _driver = None
+    _lock = threading.Lock()
 
     @classmethod
-    def _get_service(cls, browser, force_local=False):
+    def _get_service(cls, browser, force_local=False, refresh=False):
         """
         Resolves the appropriate driver service based on browser type.
 
         Args:
             browser (str): One of 'chrome', 'firefox', 'edge'.
             force_local (bool): If True, forces use of local driver path.
+            refresh (bool): If True, ignores the cached driver path and
+                installs the driver again.
 
         Returns:
             Service: Selenium WebDriver service object.
@@ -45,15 +59,18 @@ class WebDriverManager:
         service_map = {
             "chrome": lambda: ChromeService(
                 os.path.join(cwd, "driver", "chrome", "chromedriver.exe")
-                if use_local else ChromeDriverManager().install()
+                if use_local else cls._get_driver_path(
+                    "chrome", ChromeDriverManager, refresh)
             ),
             "firefox": lambda: FirefoxService(
                 os.path.join(cwd, "driver", "firefox", "geckodriver.exe")
-                if use_local else GeckoDriverManager().install()
+                if use_local else cls._get_driver_path(
+                    "firefox", GeckoDriverManager, refresh)
             ),
             "edge": lambda: EdgeService(
                 os.path.join(cwd, "driver", "edge", "msedgedriver.exe")
-                if use_local else EdgeChromiumDriverManager().install()
+                if use_local else cls._get_driver_path(
+                    "edge", EdgeChromiumDriverManager, refresh)
             ),
         }
 
@@ -62,11 +79,65 @@ class WebDriverManager:
         except KeyError:
             raise ValueError(f"Unsupported browser: {browser}")
 
+    @staticmethod
+    def _get_driver_path(browser, manager_cls, refresh=False):
+        """
+        Returns the driver binary path, installing it only when needed.
+
+        `manager_cls().install()` checks the latest driver version over the
+        network on every call. The resolved path is cached in
+        DRIVER_PATH_CACHE and reused while the binary still exists and the
+        entry is younger than DRIVER_PATH_TTL.
+
+        Args:
+            browser (str): One of 'chrome', 'firefox', 'edge'.
+            manager_cls (type): The webdriver-manager class for the browser.
+            refresh (bool): If True, the cached entry is dropped and the
+                driver installed again, e.g. after the browser updated.
+
+        Returns:
+            str: Path to the driver executable.
+        """
+        try:
+            with open(DRIVER_PATH_CACHE, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+
+        entry = (cache.pop(browser, None) if refresh
+                 else cache.get(browser)) or {}
+        path = entry.get("path")
+        if (
+            path
+            and os.path.exists(path)
+            and time.time() - entry.get("checked", 0) < DRIVER_PATH_TTL
+        ):
+            return path
+
+        path = manager_cls().install()
+        cache[browser] = {"path": path, "checked": time.time()}
+        try:
+            os.makedirs(os.path.dirname(DRIVER_PATH_CACHE), exist_ok=True)
+            with open(DRIVER_PATH_CACHE, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+        return path
+
     @classmethod
     def _get_options(cls, browser):
         """
         Returns browser-specific options.
 
+        All browsers use PAGE_LOAD_STRATEGY, block site notifications and
+        start the session with the implicit wait disabled, so missing
+        elements are reported at once and every wait is an explicit one;
+        Chromium browsers also run without extensions. When HEADLESS is
+        enabled the browser runs without a window (and without GPU
+        compositing on Chromium). When BLOCK_IMAGES is enabled image
+        loading is switched off, which saves decoding and paint time on
+        table-heavy pages.
+
         Args:
             browser (str): One of 'chrome', 'firefox', 'edge'.
 
@@ -75,39 +146,81 @@ class WebDriverManager:
         """
         if browser == "chrome":
             options = webdriver.ChromeOptions()
-            options.add_experimental_option("prefs", {
+            prefs = {
                 "credentials_enable_service": False,
                 "profile.password_manager_enabled": False
-            })
-            options.add_experimental_option("detach", True)
+            }
+            cls._add_chromium_options(options, prefs)
             return options
 
         if browser == "firefox":
             options = webdriver.FirefoxOptions()
             options.set_preference("signon.rememberSignons", False)
             options.set_preference("detach", True)
+            options.set_preference("dom.webnotifications.enabled", False)
+            options.page_load_strategy = PAGE_LOAD_STRATEGY
+            options.timeouts = {"implicit": 0}
+            if BLOCK_IMAGES:
+                options.set_preference("permissions.default.image", 2)
+            if HEADLESS:
+                options.add_argument("-headless")
             return options
 
         if browser == "edge":
             options = webdriver.EdgeOptions()
             # options.use_chromium = True
-            options.add_experimental_option("detach", True)
+            cls._add_chromium_options(options, {})
             return options
 
         raise ValueError(f"Unsupported browser: {browser}")
 
+    @staticmethod
+    def _add_chromium_options(options, prefs):
+        """
+        Applies the options shared by Chrome and Edge.
+
+        Args:
+            options (Options): Chromium-based browser options object.
+            prefs (dict): Browser-specific profile preferences; the shared
+                preferences are added to it.
+        """
+        prefs["profile.default_content_setting_values.notifications"] = 2
+        if BLOCK_IMAGES:
+            prefs["profile.managed_default_content_settings.images"] = 2
+        options.add_experimental_option("prefs", prefs)
+        options.add_experimental_option("detach", True)
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+        options.timeouts = {"implicit": 0}
+        options.add_argument("--disable-extensions")
+        if HEADLESS:
+            for arg in ("--headless=new", "--disable-gpu"):
+                options.add_argument(arg)
+
     @classmethod
     def get_driver(cls):
         """
         Returns a singleton WebDriver instance for the specified browser.
 
+        The first call creates the browser under a lock so callers on other
+        threads never start a second browser session. If the session cannot
+        be created with a cached driver (typically because the browser
+        auto-updated since the driver was installed), the driver is
+        installed again and the session retried once.
+
         Returns:
             WebDriver: Selenium WebDriver instance.
         """
-        if cls._driver is None:
+        if cls._driver is not None:
+            return cls._driver
+
+        with cls._lock:
+            if cls._driver is not None:
+                return cls._driver
+            force_local = DEBUG
             try:
                 service = cls._get_service(BROWSER)
             except Exception:
+                force_local = True
                 service = cls._get_service(BROWSER, force_local=True)
 
             options = cls._get_options(BROWSER)
@@ -121,6 +234,14 @@ class WebDriverManager:
             }
 
             # Fallback to chrome if browser is not in the map
-            cls._driver = driver_map.get(BROWSER, driver_map["chrome"])()
+            create_driver = driver_map.get(BROWSER, driver_map["chrome"])
+            try:
+                cls._driver = create_driver()
+            except SessionNotCreatedException:
+                if force_local:
+                    raise
+                # The constructors above pick up the re-installed service
+                service = cls._get_service(BROWSER, refresh=True)
+                cls._driver = create_driver()
 
         return cls._driver
@@ -8,6 +8,8 @@ timestamped log file within a dedicated `logs/` directory.
 
 Features:
     - Console and file logging with rotation (5MB max, 3 backups)
+    - Handler I/O runs on a background QueueListener thread, so logging
+      call sites only enqueue records
     - Dynamic log level based on DEBUG flag from config
     - Timestamped log filenames for traceability
     - Utility functions to log the start and end of automation runs
@@ -20,15 +22,18 @@ Author:
     Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Created: 2025-08-18
-Last Modified: 2025-10-03
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
 
 
+import atexit
 import logging
 import logging.config
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from common.config import DEBUG
 from utils.date_time_utils import get_timestamp
@@ -77,6 +82,17 @@ LOG_CONFIG = {
 logging.config.dictConfig(LOG_CONFIG)
 logger = logging.getLogger("auto_edu")
 
+# Route records through a queue so console and file writes happen off the
+# calling thread. dictConfig shares the handler instances between the root
+# and "auto_edu" loggers, so both are pointed at the same queue.
+_log_queue = queue.SimpleQueue()
+_queue_listener = QueueListener(
+    _log_queue, *logger.handlers, respect_handler_level=True)
+for _queued_logger in (logging.getLogger(), logger):
+    _queued_logger.handlers = [QueueHandler(_log_queue)]
+_queue_listener.start()
+atexit.register(_queue_listener.stop)
+
 
 def log_start():
     """
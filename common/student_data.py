@@ -16,7 +16,7 @@ Includes:
 Author: Ashish Namdev (ashish28 [at] sirt [dot] gmail [dot] com)
 
 Date Created:  2025-10-03
-Last Modified: 2025-10-03
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
@@ -36,8 +36,13 @@ class StudentData:
 
     Attributes:
         student_data (dict): Dictionary of student records keyed by unique ID.
+        normalized_data (dict): Stripped, casefolded values of the
+            `NORMALIZED_FIELDS` per student, computed once at load time.
     """
 
+    # Fields compared case-insensitively during validation
+    NORMALIZED_FIELDS = ("class",)
+
     def __init__(self, student_data):
         """
         Initializes the StudentData instance with parsed student records.
@@ -48,6 +53,15 @@ class StudentData:
                 (e.g., PEN number or Aadhaar suffix).
         """
         self.student_data = student_data
+        self.normalized_data = {
+            main_key: {
+                field: str(record[field]).strip().casefold()
+                for field in self.NORMALIZED_FIELDS
+                if field in record
+            }
+            for main_key, record in student_data.items()
+            if isinstance(record, dict)
+        }
 
     def update_student_data(self, main_key, kwargs):
         """
@@ -82,6 +96,32 @@ class StudentData:
             logger.warning("%s not found in student data. No update made.",
                            main_key)
 
+    def bulk_update(self, updates):
+        """
+        Applies updates to several student records at once.
+
+        Equivalent to calling `update_student_data` for each entry, except
+        that the timestamp is computed once and shared by every record in
+        the batch.
+
+        Args:
+            updates (dict): Mapping of main key to the dictionary of fields
+                            to update for that student.
+
+        Returns:
+            None
+        """
+        timestamp = get_timestamp(format="%d-%m-%Y - %I:%M:%S %p")
+        for main_key, kwargs in updates.items():
+            record = self.student_data.get(main_key)
+            if record is None:
+                logger.warning("%s not found in student data. No update made.",
+                               main_key)
+                continue
+            record.update(kwargs)
+            record["Date and Time"] = timestamp
+        logger.debug("Bulk updated %d student records", len(updates))
+
     def get_student_data(self):
         """
         Retrieves the full student data dictionary.
@@ -90,3 +130,17 @@ class StudentData:
             dict: All student records keyed by their unique identifiers.
         """
         return self.student_data
+
+    def get_normalized_value(self, main_key, field):
+        """
+        Retrieves the precomputed normalized (stripped, casefolded) value of
+        a field for a student.
+
+        Args:
+            main_key (str): Unique identifier for the student.
+            field (str): One of `NORMALIZED_FIELDS`.
+
+        Returns:
+            str | None: The normalized value, or None if unavailable.
+        """
+        return self.normalized_data.get(main_key, {}).get(field)
@@ -14,7 +14,7 @@ Classes:
 Author: Ashish Namdev (ashish28 [at] sirt [dot] gmail [dot] com)
 
 Date Created:  2025-08-21
-Last Modified: 2025-10-17
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
@@ -38,19 +38,33 @@ class Student:
     Attributes:
         student_pen (str): Unique identifier for the student.
         student_data (dict): Dictionary containing all student records.
+        pen_valid (bool): Whether the PEN passed format validation when
+                          the import data was parsed.
     """
 
-    def __init__(self, student_pen, student_data):
+    __slots__ = (
+        "student_data",
+        "_student_pen",
+        "pen_valid",
+        "_pen_dob",
+        "current_school",
+        "searched_pen_no",
+    )
+
+    def __init__(self, student_pen, student_data, pen_valid=True):
         """
         Initializes a Student instance with a PEN and import data.
 
         Args:
             student_pen (str): Unique identifier for the student.
             student_student_data (dict): Dictionary of all student records.
+            pen_valid (bool, optional): Result of the parse-time PEN
+                                        validation. Defaults to True.
         """
 
         self.student_data = student_data
         self._student_pen = student_pen
+        self.pen_valid = pen_valid
         self._pen_dob = None
         self.current_school = None
         self.searched_pen_no = None
@@ -73,6 +87,15 @@ class Student:
         """
         return self.searched_pen_no
 
+    def is_pen_valid(self):
+        """
+        Returns whether the student's PEN passed parse-time validation.
+
+        Returns:
+            bool: True if the PEN is well-formed, False otherwise.
+        """
+        return self.pen_valid
+
     def get_student_pen(self):
         """
         Retrieves the student's Permanent Education Number (PEN).
@@ -18,13 +18,15 @@ Usage:
 Author: Ashish Namdev (ashish28 [at] sirt [dot] gmail [dot] com)
 
 Date Created:  2025-08-20
-Last Modified: 2025-10-24
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
 
 import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from common.logger import logger
 from common.student_data import StudentData
@@ -45,8 +47,42 @@ class StudentImport:
     Attributes:
         import_ui (StudentImportUI): UI handler for student import
                                     interactions.
+        import_errors (dict): Import error statuses mapped to the remark
+                              recorded for the student.
     """
 
+    # Remarks are interned: they are written into every failed record
+    import_errors = {sys.intern(key): sys.intern(remark) for key, remark in {
+        "dob_error": (
+            "The entered Date of Birth(DOB) does not match "
+            "with the respective Student PEN"
+        ),
+        "aadhaar_dob_missing": "Aadhaar DOB missing",
+        "dob_retry_skipped": (
+            "Retry with Aadhaar DOB skipped as it matches PEN DOB"
+        ),
+        "unknown": (
+            "Unexpected error during import — "
+            "may involve Selenium timeouts, UI "
+            "failures, or system-level issues."
+        )
+    }.items()}
+    # Import error statuses caused by a DOB mismatch
+    _DOB_ERROR_KEYS = frozenset(key for key in import_errors if "dob" in key)
+
+    __slots__ = (
+        "logged_in_school",
+        "_logged_in_school_cf",
+        "import_ui",
+        "student",
+        "release_requests",
+        "pen_dob",
+        "student_data",
+        "dob_error_students",
+        "_pending_updates",
+        "_invalid_pens",
+    )
+
     def __init__(self, logged_in_school):
         """
         Initialize the StudentImport controller.
@@ -54,30 +90,16 @@ class StudentImport:
         Performs login to the UDISE portal using credentials from config,
         and sets up the UI handler for import operations.
         """
-        self.logged_in_school = logged_in_school
+        self.logged_in_school = logged_in_school.strip()
+        self._logged_in_school_cf = self.logged_in_school.casefold()
         self.import_ui = StudentImportUI()
         self.student = None
         self.release_requests = []
-        self.import_errors = {
-            "dob_error": (
-                "The entered Date of Birth(DOB) does not match "
-                "with the respective Student PEN"
-            ),
-            "aadhaar_dob_missing": "Aadhaar DOB missing",
-            "dob_retry_skipped": (
-                "Retry with Aadhaar DOB skipped as it matches PEN DOB"
-            ),
-            "unknown": (
-                "Unexpected error during import — "
-                "may involve Selenium timeouts, UI "
-                "failures, or system-level issues."
-            )
-        }
         self.pen_dob = None
         self.student_data = None
-        self.dob_errors = [
-            key for key in self.import_errors if "dob" in key]
         self.dob_error_students = {}
+        self._pending_updates = {}
+        self._invalid_pens = set()
 
     def _prepare_import_data(self):
         """
@@ -96,6 +118,13 @@ class StudentImport:
         data_parser.parse_data()
         self.student_data = StudentData(data_parser.get_parsed_data())
 
+        # PENs are fixed once parsed; validate each one a single time
+        self._invalid_pens = {
+            pen_no for pen_no in self.student_data.get_student_data()
+            if self._is_invalid_pen_no(pen_no)
+        }
+        self._flush_updates()
+
     def start_student_import(self):
         """
         Start the student import workflow.
@@ -103,9 +132,14 @@ class StudentImport:
         Triggers UI interactions to select import options and
         prepare the portal for data ingestion.
         This method serves as the entry point for the import process.
+
+        Parsing the import data does not touch the browser, so it runs on a
+        worker thread while the import options are being selected.
         """
-        self.import_ui.select_import_options()
-        self._prepare_import_data()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prepare_future = executor.submit(self._prepare_import_data)
+            self.import_ui.select_import_options()
+            prepare_future.result()
         total_students = len(self.student_data.get_student_data())
         logger.info(
             "[UDISEStudentImport] Starting student import: %s records to process",
@@ -115,13 +149,6 @@ class StudentImport:
         try:
             self._import_students()
 
-            # Try reimport students with DOB Error
-            if self.dob_error_students:
-                logger.info("[UDISEStudentImport] Retrying import for "
-                            "students: %s",
-                            self.dob_error_students.keys())
-                self._import_students()
-
             if self.release_requests:
                 ReleaseRequest(self.release_requests,
                                self.student_data).start_release_request()
@@ -141,6 +168,29 @@ class StudentImport:
                            ).save(first_column="Student PEN Number")
 
     def _import_students(self):
+        """
+        Imports all students from the prepared data, then retries the
+        students that failed with a DOB error.
+
+        The retry pass reuses the `Student` objects collected during the
+        first pass, so PEN/DOB values already found via Aadhaar search are
+        preserved and not searched again.
+        """
+        student_data_dict = self.student_data.get_student_data()
+        self._import_pass(
+            (pen_no, Student(pen_no, data,
+                             pen_valid=pen_no not in self._invalid_pens))
+            for pen_no, data in student_data_dict.items()
+        )
+
+        # Try reimport students with DOB Error
+        if self.dob_error_students:
+            logger.info("[UDISEStudentImport] Retrying import for "
+                        "students: %s",
+                        self.dob_error_students.keys())
+            self._import_pass(list(self.dob_error_students.items()))
+
+    def _import_pass(self, students):
         """
         Imports a batch of students by validating their DOB and determining
         import eligibility.
@@ -153,76 +203,110 @@ class StudentImport:
         - Otherwise, fills in import details such as class, section,
             and admission date and submits the import form.
 
+        Args:
+            students (Iterable[tuple[str, Student]]): (PEN number, Student)
+                pairs to import in this pass.
+
         Side Effects:
             - Logs status messages for each student.
             - Triggers UI operations for import, release, or detail filling.
         """
         logger.info("Starting Student Import workflow")
         ui = self.import_ui
-        student_data_dict = self.student_data.get_student_data()
-        use_dob_errors = bool(self.dob_error_students)
 
-        # Unified source of PENs
-        pen_numbers = (
-            self.dob_error_students.keys()
-            if use_dob_errors else student_data_dict.keys()
-        )
-
-        for count, pen_no in enumerate(pen_numbers):
+        for count, (pen_no, student) in enumerate(students, start=1):
             logger.info(
-                "[UDISEStudentImport] Processing Student_%s",
-                count + 1)
+                "[UDISEStudentImport] Processing Student_%s", count)
             self.pen_dob = None
 
-            student = (
-                self.dob_error_students.get(pen_no)
-                if use_dob_errors else Student(pen_no, student_data_dict.get(pen_no))
-            )
+            try:
+                with ui.begin_student(pen_no):
+                    self._import_student(student, pen_no)
+            finally:
+                self._flush_updates()
+
+    def _import_student(self, student, pen_no):
+        """
+        Runs the import workflow for a single student.
+
+        Called once per student from `_import_pass` inside the
+        `StudentImportUI.begin_student` scope, so UI elements resolved
+        here are reused for this student only.
+
+        Args:
+            student (Student): The student being imported.
+            pen_no (str): The student's PEN number from the input data.
+        """
+        ui = self.import_ui
 
-            if self._is_invalid_pen_no(pen_no):
+        if not student.is_pen_valid():
+            if student.get_searched_pen_no() is None:
                 self.search_pen_and_dob(student)
-                if student.get_searched_pen_no() is None:
-                    continue
+            if student.get_searched_pen_no() is None:
+                return
 
-            status = self._try_import_student(student)
-            logger.info("status after import attempt: %s", status)
-            student.set_pen_dob(self.pen_dob)
-            current_school = self.logged_in_school
+        status = self._try_import_student(student)
+        logger.debug("status after import attempt: %s", status)
+        student.set_pen_dob(self.pen_dob)
+        current_school = self.logged_in_school
 
-            if status == "active":
-                current_school = ui.get_student_current_school().strip()
-                student.set_current_school(current_school)
+        if status == "active":
+            current_school = ui.get_student_current_school()
+            student.set_current_school(current_school)
 
-                if self._is_school_matched(pen_no, current_school):
-                    continue
+            if self._is_school_matched(pen_no, current_school):
+                return
 
-                self._prepare_release_request(student)
+            self._prepare_release_request(student)
 
-            elif self._is_dob_error(pen_no, status):
-                # Handle DOB mismatch by re-searching PEN and DOB
+        elif self._is_dob_error(pen_no, status):
+            # Handle DOB mismatch by re-searching PEN and DOB, unless the
+            # search already ran for this student in an earlier pass
+            if student.get_searched_pen_no() is None:
                 self.search_pen_and_dob(student)
-                self.dob_error_students.update({pen_no: student})
+            self.dob_error_students.update({pen_no: student})
 
-            elif self._is_import_error(pen_no, status):
-                continue
+        elif self._is_import_error(pen_no, status):
+            return
 
-            elif self._is_class_mismatch(pen_no, student.get_class()):
-                continue
+        elif self._is_class_mismatch(pen_no, student.get_class()):
+            return
 
-            else:
-                current_school = ui.get_student_current_school().strip()
-                ui.submit_import_data(
-                    student.get_class(),
-                    student.get_section(),
-                    student.get_admission_date()
-                )
-                status = str(ui.get_import_message()).strip()
-                logger.info("%s : %s", pen_no, status)
-                self.student_data.update_student_data(
-                    pen_no, {"Remark": status, "Import Status": "Yes"})
+        else:
+            current_school = ui.get_student_current_school()
+            ui.submit_import_data(
+                student.get_class(),
+                student.get_section(),
+                student.get_admission_date()
+            )
+            status = str(ui.get_import_message()).strip()
+            logger.info("%s : %s", pen_no, status)
+            self._queue_update(
+                pen_no, {"Remark": status, "Import Status": "Yes"})
 
-            student.set_current_school(current_school)
-            logger.info("Processing next student for import")
+        student.set_current_school(current_school)
+        logger.debug("Processing next student for import")
+
+    def _queue_update(self, pen_no, patch):
+        """
+        Buffers a student data update until the end of the current student.
+
+        Patches for the same PEN are merged, so a student that passes
+        through several checks is written to `StudentData` only once.
+
+        Args:
+            pen_no (str): Key of the student record to update.
+            patch (dict): Fields to update for the student.
+        """
+        self._pending_updates.setdefault(pen_no, {}).update(patch)
+
+    def _flush_updates(self):
+        """
+        Applies all buffered student data updates to `StudentData`.
+        """
+        for pen_no, patch in self._pending_updates.items():
+            self.student_data.update_student_data(pen_no, patch)
+        self._pending_updates.clear()
 
     def _try_import_student(self, student):
         """
@@ -251,25 +335,36 @@ class StudentImport:
                 - "dob_retry_skipped": Retry skipped due to identical DOBs.
                 - Other error codes as returned by the UI.
         """
-        logger.info("Attempting import for current student record")
+        logger.debug("Attempting import for current student record")
         ui = self.import_ui
         pen_no = student.get_student_pen()
         searhced_pen_no = student.get_searched_pen_no()
         pen_no = searhced_pen_no if searhced_pen_no else pen_no
 
         if searhced_pen_no is None:
-            dob_attempts = [
-                ("PEN", student.get_dob()),
-                ("Aadhaar", student.get_adhaar_dob())
-            ]
+            pen_dob = student.get_dob()
+            adhaar_dob = student.get_adhaar_dob()
         else:
-            dob_attempts = [("PEN", student.get_pen_dob())]
+            pen_dob = student.get_pen_dob()
+            adhaar_dob = None
 
-        for source, dob in dob_attempts:
-            if source == "Aadhaar" and dob is None:
-                logger.info("Aadhaar DOB Missing")
-                return "aadhaar_dob_missing"
+        # Normalize once, compared after a failed PEN attempt
+        pen_dob_s = str(pen_dob).strip()
+        adhaar_dob_s = (
+            str(adhaar_dob).strip() if adhaar_dob is not None else None
+        )
+
+        # Only queue an Aadhaar attempt that can succeed where PEN DOB
+        # failed; a missing or identical Aadhaar DOB is a doomed retry
+        dob_attempts = [("PEN", pen_dob)]
+        if (
+            searhced_pen_no is None
+            and adhaar_dob_s is not None
+            and adhaar_dob_s != pen_dob_s
+        ):
+            dob_attempts.append(("Aadhaar", adhaar_dob))
 
+        for source, dob in dob_attempts:
             ui.import_student(pen_no, dob)
             if ui.get_pen_status() == "dob_error":
                 status = ui.get_ui_dob_status()
@@ -277,22 +372,23 @@ class StudentImport:
                 logger.error("%s - %s: %s", pen_no, dob, status)
                 logger.debug("source = %s, dob = %s", source, dob)
 
-                # Skip retry if Aadhaar DOB is same as PEN DOB
-                if (
-                    source == "PEN"
-                    and str(dob_attempts[1][1]).strip() == str(dob).strip()
-                ):
-                    logger.info("Aadhaar DOB is same as PEN DOB")
-                    return "dob_retry_skipped"
-
             else:
                 # Set PEN DOB to working DOB
                 self.pen_dob = dob
                 status = ui.get_student_status()
                 logger.info("%s : %s", pen_no, status)
-                self.student_data.update_student_data(
+                self._queue_update(
                     student.get_student_pen(), {"PEN DOB": self.pen_dob})
                 return status
+
+        # Explain why no Aadhaar retry was made after the PEN attempt
+        if searhced_pen_no is None:
+            if adhaar_dob_s is None:
+                logger.info("Aadhaar DOB Missing")
+                return "aadhaar_dob_missing"
+            if adhaar_dob_s == pen_dob_s:
+                logger.info("Aadhaar DOB is same as PEN DOB")
+                return "dob_retry_skipped"
         return "dob_error"
 
     def _is_school_matched(self, pen_no, current_school):
@@ -316,13 +412,12 @@ class StudentImport:
                 False otherwise.
         """
 
-        logged_in_school = self.logged_in_school.strip()
-
         return not self._handle_field_validation(
             "School", pen_no,
-            logged_in_school, current_school,
+            self.logged_in_school, current_school,
             update_on_match=True, match_remark="Already Imported",
-            update_on_mismatch=False  # Don't update if mismatch
+            update_on_mismatch=False,  # Don't update if mismatch
+            expected_cf=self._logged_in_school_cf
         )
 
     def _is_class_mismatch(self, pen_no, student_class):
@@ -351,7 +446,9 @@ class StudentImport:
             student_class,
             self.import_ui.get_import_class(),
             update_on_match=False,
-            update_on_mismatch=True
+            update_on_mismatch=True,
+            expected_cf=self.student_data.get_normalized_value(
+                pen_no, "class")
         )
 
     def _is_invalid_pen_no(self, pen_no):
@@ -380,7 +477,7 @@ class StudentImport:
             logger.error(
                 "%s : Invalid PEN no. retrying searching PEN with adhaar",
                 pen_no)
-            self.student_data.update_student_data(
+            self._queue_update(
                 pen_no,
                 {
                     "Remark": "Invalid PEN no.",
@@ -417,7 +514,7 @@ class StudentImport:
             pen_no,
             error_remark,
         )
-        self.student_data.update_student_data(
+        self._queue_update(
             pen_no,
             {
                 "Remark": error_remark,
@@ -445,13 +542,13 @@ class StudentImport:
             bool: True if the status is recognized as an dob error,
                     False otherwise.
         """
-        if status not in self.dob_errors:
+        if status not in self._DOB_ERROR_KEYS:
             return False
 
         error_msg = "DOB Error in Student Import (dob_error/aadhaar_dob_missing)"
         logger.warning(
             "%s : Skipping import due to %s issues", pen_no, error_msg)
-        self.student_data.update_student_data(
+        self._queue_update(
             pen_no,
             {
                 "Remark": error_msg,
@@ -468,7 +565,8 @@ class StudentImport:
         actual_value,
         update_on_match=False,
         update_on_mismatch=True,
-        match_remark="Already Imported"
+        match_remark="Already Imported",
+        expected_cf=None
     ):
         """
         Validates a field by comparing expected and actual values
@@ -484,14 +582,19 @@ class StudentImport:
             update_on_mismatch (bool): Whether to update import data on
                                        mismatch.
             match_remark (str): Remark to use when values match.
+            expected_cf (str, optional): Precomputed stripped and casefolded
+                                         form of `expected_value`; computed
+                                         here when not provided.
 
         Returns:
             bool: True if mismatch detected, False otherwise.
         """
         expected = str(expected_value).strip()
         actual = str(actual_value).strip()
+        if expected_cf is None:
+            expected_cf = expected.casefold()
 
-        if expected.casefold() != actual.casefold():
+        if expected_cf != actual.casefold():
             logger.warning(
                 "%s : %s mismatch. Expected: %s, Actual: %s",
                 pen_no,
@@ -505,7 +608,7 @@ class StudentImport:
                     f"  Expected - {expected}\n"
                     f"  Actual   - {actual}"
                 )
-                self.student_data.update_student_data(
+                self._queue_update(
                     pen_no,
                     {
                         "Remark": remark,
@@ -522,7 +625,7 @@ class StudentImport:
             actual,
         )
         if update_on_match:
-            self.student_data.update_student_data(
+            self._queue_update(
                 pen_no,
                 {
                     "Remark": match_remark,
@@ -550,7 +653,7 @@ class StudentImport:
             pen_no,
             student.get_current_school()
         )
-        self.student_data.update_student_data(
+        self._queue_update(
             pen_no,
             {
                 "Remark": "Active in another school",
@@ -574,6 +677,8 @@ class StudentImport:
         """
         logger.info("Searching PEN and DOB for adhaar number %s",
                     student.get_adhaar_number())
+        # SearchPEN writes to StudentData directly; keep updates in order
+        self._flush_updates()
         searcher = SearchPEN(student, self.student_data)
         searcher.search_pen_and_dob()
 
@@ -585,7 +690,7 @@ class StudentImport:
                 "PEN not found for Aadhaar number: %s",
                 student.get_adhaar_number()
             )
-            self.student_data.update_student_data(
+            self._queue_update(
                 student.get_student_pen(),
                 {
                     "Remark": "PEN not found using Aadhaar",
@@ -9,15 +9,17 @@ configuration.
 Author: Ashish Namdev (ashish28 [at] sirt [dot] gmail [dot] com)
 
 Date Created:  2025-12-09
-Last Modified: 2026-01-21
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
 
+import json
 import os
-import time
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 
-from common.config import CLASSES, TIME_DELAY
+from common.config import CLASSES
 from common.logger import logger
 from common.student_data import StudentData
 from portals.udise import Student
@@ -25,6 +27,10 @@ from ui.udise.section_shift_ui import StudentSectionShiftUI
 from utils.parser import StudentDataParser
 from utils.report import ReportExporter
 
+# Part of the parsed data cache key; bump whenever load_and_clean_excel or
+# parse_data change the shape of the parsed records
+CACHE_FORMAT_VERSION = 1
+
 
 class StudentSectionShift:
     """
@@ -50,9 +56,27 @@ class StudentSectionShift:
                 across all pages and classes to prevent re-processing.
             total_processed (int): Counter for the total number of students
                 processed during the workflow run.
+            _data_map (dict): The records dict held by `student_data`, bound
+                once so per-row lookups skip the getter call.
+            _data_file (str): The section shift input xlsx file.
+            _progress_path (str): JSONL file each processed student is
+                appended to, so an interrupted run can be resumed. Its
+                first line identifies the input file it belongs to.
+            _progress_file (file or None): Open handle on `_progress_path`
+                while classes are being processed.
+            _pen_section_map (dict[str, str]): Target section per PEN,
+                computed once when the input data is prepared.
         """
         self.section_shift_ui = StudentSectionShiftUI()
         self.student_data = None
+        self._data_map = {}
+        self._data_file = os.path.join(
+            os.getcwd(), "input", "udise", "section_shift.xlsx")
+        self._progress_path = os.path.join(
+            os.getcwd(), "reports", "udise",
+            "student_section_shift_progress.jsonl")
+        self._progress_file = None
+        self._pen_section_map = {}
         self.shifted_students = set()
         self.total_processed = 0
 
@@ -64,19 +88,115 @@ class StudentSectionShift:
         parses the input data, and returns the structured student data
         ready for further processing or storage.
 
+        The parsed records are cached in a pickle next to the input file,
+        keyed by the cache format version and the xlsx modification time
+        and size, so re-runs against an unchanged file skip the Excel
+        parse.
+
         Returns:
             None
         """
-        section_shift_data_file = os.path.join(
-            os.getcwd(), "input", "udise", "section_shift.xlsx")
         try:
-            data_parser = StudentDataParser(section_shift_data_file)
-            data_parser.parse_data()
-            self.student_data = StudentData(data_parser.get_parsed_data())
+            parsed_data = self._load_cached_data(self._data_file)
+            if parsed_data is None:
+                data_parser = StudentDataParser(self._data_file)
+                data_parser.parse_data()
+                parsed_data = data_parser.get_parsed_data()
+                self._save_cached_data(self._data_file, parsed_data)
+            self.student_data = StudentData(parsed_data)
+            self._data_map = self.student_data.get_student_data()
+            self._pen_section_map = {
+                pen: Student(pen, record).get_section()
+                for pen, record in self._data_map.items()
+            }
         except Exception as e:
             logger.error("Error preparing section shift data: %s", str(e))
             raise
 
+    @staticmethod
+    def _get_cache_path(data_file):
+        """
+        Returns the pickle cache path for a section shift input file.
+
+        Args:
+            data_file (str): Path to the section shift xlsx file.
+
+        Returns:
+            str: Path of the cache file under a `.cache` directory next to
+                the input file.
+        """
+        name = os.path.splitext(os.path.basename(data_file))[0]
+        return os.path.join(
+            os.path.dirname(data_file), ".cache", f"{name}.pkl")
+
+    @staticmethod
+    def _get_cache_key(data_file):
+        """
+        Returns the cache key identifying a version of the input file.
+
+        The key includes CACHE_FORMAT_VERSION, so caches written by a
+        parser producing a different record format are not reused.
+
+        Args:
+            data_file (str): Path to the section shift xlsx file.
+
+        Returns:
+            tuple[int, int, int]: The cache format version and the file's
+                modification time (ns) and size.
+        """
+        stat = os.stat(data_file)
+        return CACHE_FORMAT_VERSION, stat.st_mtime_ns, stat.st_size
+
+    def _load_cached_data(self, data_file):
+        """
+        Loads previously parsed records if the input file is unchanged.
+
+        Args:
+            data_file (str): Path to the section shift xlsx file.
+
+        Returns:
+            dict or None: The cached records, or None if there is no
+                usable cache for the current file.
+        """
+        cache_path = self._get_cache_path(data_file)
+        if not (os.path.exists(data_file) and os.path.exists(cache_path)):
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                key, parsed_data = pickle.load(f)
+        except Exception as e:
+            logger.warning("Ignoring unreadable section shift cache %s: %s",
+                           cache_path, e)
+            return None
+
+        if key != self._get_cache_key(data_file):
+            logger.debug("Section shift cache is stale: %s", cache_path)
+            return None
+
+        logger.info("Loaded section shift data from cache %s", cache_path)
+        return parsed_data
+
+    def _save_cached_data(self, data_file, parsed_data):
+        """
+        Caches freshly parsed records for later runs.
+
+        Failures are logged and otherwise ignored; the cache is only an
+        optimisation.
+
+        Args:
+            data_file (str): Path to the section shift xlsx file.
+            parsed_data (dict): The parsed records, before any updates.
+        """
+        cache_path = self._get_cache_path(data_file)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((self._get_cache_key(data_file), parsed_data), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            logger.debug("Cached section shift data to %s", cache_path)
+        except Exception as e:
+            logger.warning("Could not cache section shift data: %s", e)
+
     def start_section_shift(self):
         """
         Execute the UDISE Student Section Shift workflow across one or more classes.
@@ -89,14 +209,27 @@ class StudentSectionShift:
             - Selects the class from the dropdown.
             - Determines the total number of pages.
             - Processes each page sequentially via `_process_section_shift_page`.
-            - Navigates to the next page with a delay, if applicable.
+            - Navigates to the next page, if applicable.
         5. Logs a final summary of total processed and successfully shifted students.
-        6. Exports the final section shift report.
+        6. Starts exporting the final section shift report on a worker
+           thread, so the export overlaps with browser teardown. The
+           caller joins it through the returned future.
 
         Notes:
             - Supports both single-class and multi-class modes.
             - Skips classes with no pages instead of terminating the workflow.
             - Provides detailed logging for traceability and debugging.
+            - Parsing the input data does not touch the browser, so it runs
+              on a worker thread while the Section Shift option is opened.
+            - Each processed student is appended to a progress file as it
+              finishes. If a previous run was interrupted, its progress is
+              loaded first and already shifted students are skipped, as long
+              as it was written for the same version of the input file. The
+              progress file is removed once the final report is exported.
+
+        Returns:
+            Future: Completes once the report is exported. Call `result()`
+                after the browser is closed; it re-raises export failures.
 
         Raises:
             TimeoutException: If UI elements are not found or clickable within expected time.
@@ -104,11 +237,13 @@ class StudentSectionShift:
         """
 
         logger.info("Starting UDISE Student Section Shift workflow.")
-        self._prepare_section_shift_data()
         ui = self.section_shift_ui
 
         multi_class_mode = isinstance(CLASSES, list) and CLASSES
-        ui.select_section_shift_options(select_class=not multi_class_mode)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prepare_future = executor.submit(self._prepare_section_shift_data)
+            ui.select_section_shift_options(select_class=not multi_class_mode)
+            prepare_future.result()
 
         logger.info(
             "%s-class mode enabled. Classes: %s",
@@ -120,15 +255,39 @@ class StudentSectionShift:
                      len(CLASSES) if isinstance(CLASSES, list) else "N/A",
                      CLASSES)
 
-        for class_to_select in CLASSES:
-            self._process_class_pages(ui, class_to_select)
+        self._resume_progress()
+        os.makedirs(os.path.dirname(self._progress_path), exist_ok=True)
+        new_file = not os.path.exists(self._progress_path)
+        with open(self._progress_path, "a", encoding="utf-8",
+                  buffering=1) as self._progress_file:
+            if new_file:
+                self._progress_file.write(
+                    json.dumps(self._get_progress_header()) + "\n")
+            for class_to_select in CLASSES:
+                self._process_class_pages(ui, class_to_select)
+        self._progress_file = None
 
         logger.info(
             "Section Shift Summary: Total processed=%d, Successfully shifted=%d",
             self.total_processed, len(self.shifted_students)
         )
         logger.info("Section shift processing completed. Exporting report.")
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="section-shift-report")
+        report_future = executor.submit(self._export_and_clear_progress)
+        executor.shutdown(wait=False)
+        return report_future
+
+    def _export_and_clear_progress(self):
+        """
+        Exports the final report and removes the progress file.
+
+        Runs on the report thread started by `start_section_shift`. If the
+        export fails the error propagates to the report future and the
+        progress file is kept so the next run can resume from it.
+        """
         self._export_section_shift_report()
+        os.remove(self._progress_path)
 
     def _process_class_pages(self, ui, class_to_select):
         """
@@ -138,7 +297,8 @@ class StudentSectionShift:
         - Retrieves the total number of pages.
         - Iterates through each page sequentially.
         - Calls `_process_section_shift_page` to process student rows.
-        - Navigates to the next page with a delay, if applicable.
+        - Navigates to the next page, if applicable. The UI handler waits
+          for the new rows to render instead of sleeping a fixed delay.
         - Logs progress and warnings for visibility.
 
         Args:
@@ -147,7 +307,7 @@ class StudentSectionShift:
 
         Notes:
             - If no pages are found for the class, logs a warning and skips it.
-            - Ensures each page is processed in order, with controlled delays between transitions.
+            - Ensures each page is processed in order.
         """
 
         logger.info("Processing Class: %s", class_to_select)
@@ -166,67 +326,77 @@ class StudentSectionShift:
             self._process_section_shift_page()
 
             if page < total_pages:
-                logger.debug(
-                    "Waiting %s seconds before moving to next page",
-                    TIME_DELAY / 3)
-                time.sleep(TIME_DELAY / 3)
                 ui.go_to_next_page()
 
     def _process_section_shift_page(self):
         """
         Process all student rows on the current Section Shift UI page.
 
-        Iterates through the Section Shift table, attempts section shifts,
-        and updates student data. Handles UI refreshes after successful shifts
-        and exits once all students are processed.
+        Reads the PEN and section of every row once, then attempts section
+        shifts and updates student data in a single pass. A shift may make
+        the table re-render, so the row element is resolved (and checked
+        against the expected PEN) only when a shift is actually needed,
+        rather than re-reading the whole table after every success.
+
+        Students whose UI section already matches the prepared data are
+        settled up front with a single batched update; only the remaining
+        rows go through `_process_single_student`.
         """
         ui = self.section_shift_ui
         processed = set()
 
-        while True:
-            student_rows = self._fetch_student_rows()
-            if not student_rows:
-                logger.warning("No students found on this page.")
-                break
-
-            logger.info("Total Students currently on this page: %d",
-                        len(student_rows))
-            progress_made = False
-
-            for student_row in student_rows:
-                student_pen, ui_section = ui.get_ui_student_pen_and_section(
-                    student_row)
-
-                if self._skip_student(student_pen, processed):
-                    continue
+        student_rows = ui.snapshot_section_shift_rows()
+        if not student_rows:
+            logger.warning("No students found on this page.")
+            return
 
-                status = self._process_single_student(
-                    student_row, student_pen, ui_section)
+        logger.info("Total Students currently on this page: %d",
+                    len(student_rows))
 
-                processed.add(student_pen)
+        # Nothing to do if every known PEN on the page was already shifted
+        # (typical when resuming); skip the per-row checks entirely
+        known = {pen for _, pen, _ in student_rows if pen in self._data_map}
+        if known and known <= self.shifted_students:
+            logger.info("All students on this page already shifted.")
+            return
 
-                if "SUCCESS" in status.upper():
-                    self.shifted_students.add(student_pen)
-                    progress_made = True
-                    break  # refresh immediately
+        needs_shift = []
+        matched = {}
+        for row_index, student_pen, ui_section in student_rows:
+            if self._skip_student(student_pen, processed):
+                continue
+            processed.add(student_pen)
+            if self._is_section_mismatch(
+                    ui_section, self._pen_section_map[student_pen]):
+                needs_shift.append((row_index, student_pen, ui_section))
+            else:
+                matched[student_pen] = {
+                    "Section Shift Status": "Yes",
+                    "Remark": "Section Matched Already",
+                    "Old Section": ui_section,
+                    "Updated Section": ui_section,
+                }
+
+        if matched:
+            self.student_data.bulk_update(matched)
+            for student_pen in matched:
+                self._record_progress(student_pen)
+            logger.info("%d students already in the correct section",
+                        len(matched))
+
+        total = len(needs_shift)
+        for count, (row_index, student_pen, ui_section) in enumerate(
+                needs_shift, start=1):
+            status, is_success = self._process_single_student(
+                row_index, student_pen, ui_section)
+            logger.info("[%d/%d] PEN=%s status=%s",
+                        count, total, student_pen, status)
+
+            if is_success:
+                self.shifted_students.add(student_pen)
 
-            if not progress_made:
-                break
         self.total_processed += len(processed)
 
-    def _fetch_student_rows(self):
-        """
-        Retrieve the current list of student rows from the
-        Section Shift UI table.
-
-        Calls the UI helper to access the data table and
-        returns all row elements for further processing.
-        """
-        ui = self.section_shift_ui
-        return ui.get_section_shift_table_rows(
-            ui.get_section_shift_data_table()
-        )
-
     def _skip_student(self, student_pen, processed):
         """
         Check whether a student should be skipped during section shift
@@ -252,53 +422,50 @@ class StudentSectionShift:
             return True
 
         if student_pen in self.shifted_students:
-            logger.info(
+            logger.debug(
                 "Student PEN %s already shifted earlier. Skipping.",
                 student_pen)
             return True
 
         if student_pen in processed:
-            logger.info(
+            logger.debug(
                 "Student PEN %s already processed in this pass. Skipping.",
                 student_pen)
             return True
 
         return False
 
-    def _process_single_student(self, student_row, student_pen, ui_section):
+    def _process_single_student(self, row_index, student_pen, ui_section):
         """
         Handle section shift processing for a single student row.
 
         This method:
         * Logs the student being processed.
-        * Retrieves the student's prepared data and current section.
+        * Looks up the student's target section from the precomputed map.
         * Attempts a section shift operation via the UI.
         * Updates the internal student data store with the outcome,
             including status, remarks, and section changes.
-        * Waits briefly to respect UI timing before returning.
 
         Args:
-            student_row: The UI row element representing the student entry.
+            row_index (int): Position of the student's row in the table.
             student_pen (str): Unique PEN identifier for the student.
             ui_section (str): Section value retrieved from the UI for
                                 the student.
 
         Returns:
-            str: The status message from the section shift attempt
-                (e.g., "SUCCESS", "Already Matched", "Skipped").
+            tuple[str, bool]: The status message from the section shift
+                attempt (e.g., "SUCCESS", "Already Matched", "Skipped") and
+                whether the UI reported the shift as successful.
         """
 
-        logger.info("Processing Student PEN: %s", student_pen)
+        logger.debug("Processing Student PEN: %s", student_pen)
 
-        student_data = self.student_data.get_student_data().get(student_pen)
-        student = Student(student_pen, student_data)
-        student_section = student.get_section()
+        student_section = self._pen_section_map[student_pen]
 
-        status, section_shift_status = self._handle_section_shift(
-            student_pen, ui_section, student_section, student_row
+        status, section_shift_status, is_success = self._handle_section_shift(
+            student_pen, ui_section, student_section, row_index
         )
 
-        logger.info("%s: Section Shift Status: %s", student_pen, status)
         self.student_data.update_student_data(
             student_pen,
             {
@@ -308,12 +475,90 @@ class StudentSectionShift:
                 "Updated Section": student_section,
             },
         )
+        self._record_progress(student_pen)
+
+        return status, is_success
 
-        self._wait_between_students()
-        return status
+    def _record_progress(self, student_pen):
+        """
+        Appends a student's updated record to the progress file.
+
+        The file is line buffered, so each student is on disk as soon as it
+        has been processed.
+
+        Args:
+            student_pen (str): PEN of the student that was just processed.
+        """
+        if self._progress_file is None:
+            return
+        self._progress_file.write(json.dumps(
+            {"pen": student_pen, **self._data_map[student_pen]},
+            ensure_ascii=False) + "\n")
+
+    def _get_progress_header(self):
+        """
+        Returns the header identifying the input file a progress file
+        belongs to.
+
+        Returns:
+            dict: The input file path and its cache key.
+        """
+        return {
+            "source": self._data_file,
+            "key": list(self._get_cache_key(self._data_file)),
+        }
+
+    def _resume_progress(self):
+        """
+        Applies the progress left behind by an interrupted run.
+
+        Records in the progress file overwrite the freshly parsed ones, and
+        students whose section shift succeeded are marked as shifted so
+        they are skipped. A truncated last line is ignored.
+
+        A progress file written for a different input file (or a different
+        version of it) is not applied; it is renamed with a `.stale` suffix
+        so the new run starts a fresh one.
+        """
+        if not os.path.exists(self._progress_path):
+            return
+
+        resumed = 0
+        with open(self._progress_path, encoding="utf-8") as f:
+            try:
+                matches = (json.loads(f.readline()) ==
+                           self._get_progress_header())
+            except json.JSONDecodeError:
+                matches = False
+            if matches:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.debug("Skipping partial progress line: %r",
+                                     line)
+                        continue
+                    student_pen = record.pop("pen", None)
+                    if student_pen not in self._data_map:
+                        continue
+                    self._data_map[student_pen].update(record)
+                    if record.get("Section Shift Status") == "Yes":
+                        self.shifted_students.add(student_pen)
+                    resumed += 1
+
+        if not matches:
+            stale_path = self._progress_path + ".stale"
+            os.replace(self._progress_path, stale_path)
+            logger.warning(
+                "Progress file %s does not belong to %s; moved it to %s",
+                self._progress_path, self._data_file, stale_path)
+            return
+
+        logger.warning("Resumed %d students for %s from %s",
+                       resumed, self._data_file, self._progress_path)
 
     def _handle_section_shift(self, student_pen, ui_section,
-                              student_section, student_row):
+                              student_section, row_index):
         """
         Handle the section shift logic for a single student row.
 
@@ -327,26 +572,34 @@ class StudentSectionShift:
             student_pen (str): The PEN number of the student being processed.
             ui_section (str): The section value retrieved from the UI table.
             student_section (str): The section value from prepared student data.
-            student_row (WebElement): The table row element corresponding to the student.
+            row_index (int): Position of the student's row in the table; the
+                row element is only resolved if a shift is needed.
 
         Returns:
-            tuple[str, str]: A tuple containing:
+            tuple[str, str, bool]: A tuple containing:
                 - status (str): The message describing the result of the section shift.
                 - section_shift_status (str): "Yes" if the section shift was successful
                 or already matched, "No" otherwise.
+                - is_success (bool): Whether the UI reported a successful
+                shift; the status is classified once here and reused by
+                the caller.
         """
         ui = self.section_shift_ui
         if self._is_section_mismatch(ui_section, student_section):
-            logger.info(
+            logger.debug(
                 "%s: Section Mismatch, UDISE Section-%s, Student Section-%s",
                 student_pen,
                 ui_section,
                 student_section,
             )
+            student_row = ui.get_section_shift_row(row_index, student_pen)
+            if student_row is None:
+                return "Student row not found on page", "No", False
             ui.shift_section(student_pen, student_section, student_row)
             status = ui.get_section_shift_message()
-            return status, "Yes" if "Successfully" in status else "No"
-        return "Section Matched Already", "Yes"
+            is_success = "Successfully" in status
+            return status, "Yes" if is_success else "No", is_success
+        return "Section Matched Already", "Yes", False
 
     def _student_pen_exists(self, student_pen):
         """
@@ -360,12 +613,7 @@ class StudentSectionShift:
             bool: True if the PEN is present in the student data,
                     False otherwise.
         """
-        return student_pen in self.student_data.get_student_data()
-
-    def _wait_between_students(self):
-        """Helper to log and wait between student processing."""
-        logger.debug("Waiting for %s seconds", TIME_DELAY / 3)
-        time.sleep(TIME_DELAY / 3)
+        return student_pen in self._data_map
 
     def _is_section_mismatch(self, ui_section, student_section):
         """
@@ -392,7 +640,7 @@ class StudentSectionShift:
             None
         """
         try:
-            ReportExporter(self.student_data.get_student_data(),
+            ReportExporter(self._data_map,
                            report_sub_dir="udise",
                            filename="student_section_shift_report"
                            ).save(first_column="Student PEN Number")
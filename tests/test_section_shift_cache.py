@@ -0,0 +1,64 @@
+import os
+
+from portals.udise.student_module import section_shift
+from portals.udise.student_module.section_shift import StudentSectionShift
+
+PARSED_DATA = {"1234567890": {"Class": "5", "Section": "B"}}
+
+
+def _make_section_shift():
+    # Skip __init__, which creates the UI handler and needs a browser
+    return StudentSectionShift.__new__(StudentSectionShift)
+
+
+def _make_data_file(tmp_path, content=b"xlsx"):
+    data_file = tmp_path / "section_shift.xlsx"
+    data_file.write_bytes(content)
+    return str(data_file)
+
+
+def test_cache_hit(tmp_path):
+    shift = _make_section_shift()
+    data_file = _make_data_file(tmp_path)
+
+    assert shift._load_cached_data(data_file) is None
+    shift._save_cached_data(data_file, PARSED_DATA)
+
+    assert os.path.exists(shift._get_cache_path(data_file))
+    assert shift._load_cached_data(data_file) == PARSED_DATA
+
+
+def test_cache_invalidated_on_mtime_change(tmp_path):
+    shift = _make_section_shift()
+    data_file = _make_data_file(tmp_path)
+    shift._save_cached_data(data_file, PARSED_DATA)
+
+    stat = os.stat(data_file)
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert shift._load_cached_data(data_file) is None
+
+
+def test_cache_invalidated_on_size_change(tmp_path):
+    shift = _make_section_shift()
+    data_file = _make_data_file(tmp_path)
+    shift._save_cached_data(data_file, PARSED_DATA)
+
+    stat = os.stat(data_file)
+    with open(data_file, "ab") as f:
+        f.write(b"more")
+    # Keep the old mtime so only the size differs
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert shift._load_cached_data(data_file) is None
+
+
+def test_cache_invalidated_on_format_version_bump(tmp_path, monkeypatch):
+    shift = _make_section_shift()
+    data_file = _make_data_file(tmp_path)
+    shift._save_cached_data(data_file, PARSED_DATA)
+
+    monkeypatch.setattr(section_shift, "CACHE_FORMAT_VERSION",
+                        section_shift.CACHE_FORMAT_VERSION + 1)
+
+    assert shift._load_cached_data(data_file) is None
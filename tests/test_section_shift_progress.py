@@ -0,0 +1,68 @@
+import json
+import os
+
+from portals.udise.student_module.section_shift import StudentSectionShift
+
+
+def _make_section_shift(tmp_path):
+    # Skip __init__, which creates the UI handler and needs a browser
+    shift = StudentSectionShift.__new__(StudentSectionShift)
+    data_file = tmp_path / "section_shift.xlsx"
+    data_file.write_bytes(b"xlsx")
+    shift._data_file = str(data_file)
+    shift._progress_path = str(tmp_path / "progress.jsonl")
+    shift._data_map = {
+        "111": {"Section": "A", "Section Shift Status": ""},
+        "222": {"Section": "B", "Section Shift Status": ""},
+        "333": {"Section": "C", "Section Shift Status": ""},
+    }
+    shift.shifted_students = set()
+    return shift
+
+
+def _write_progress(path, header, records, tail=""):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header) + "\n")
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.write(tail)
+
+
+def test_resume_from_partial_progress(tmp_path):
+    shift = _make_section_shift(tmp_path)
+    _write_progress(
+        shift._progress_path,
+        shift._get_progress_header(),
+        [
+            {"pen": "111", "Section": "A", "Section Shift Status": "Yes"},
+            {"pen": "222", "Section": "B", "Section Shift Status": "No"},
+        ],
+        # Interrupted while writing the third record
+        tail='{"pen": "333", "Section": "C", "Sec',
+    )
+
+    shift._resume_progress()
+
+    assert shift.shifted_students == {"111"}
+    assert shift._data_map["111"]["Section Shift Status"] == "Yes"
+    assert shift._data_map["222"]["Section Shift Status"] == "No"
+    assert shift._data_map["333"]["Section Shift Status"] == ""
+    assert os.path.exists(shift._progress_path)
+
+
+def test_resume_ignores_progress_for_other_input(tmp_path):
+    shift = _make_section_shift(tmp_path)
+    header = shift._get_progress_header()
+    header["key"][1] -= 1
+    _write_progress(
+        shift._progress_path,
+        header,
+        [{"pen": "111", "Section": "A", "Section Shift Status": "Yes"}],
+    )
+
+    shift._resume_progress()
+
+    assert shift.shifted_students == set()
+    assert shift._data_map["111"]["Section Shift Status"] == ""
+    assert not os.path.exists(shift._progress_path)
+    assert os.path.exists(shift._progress_path + ".stale")
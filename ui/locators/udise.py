@@ -14,7 +14,7 @@ Dependencies:
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Date Created: 2025-08-19
-Last Modified: 2026-01-08
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
@@ -55,7 +55,7 @@ class StudentLoginLocators:
     Attributes:
         -----------
         USERNAME : tuple
-            Locator for the username input field (by class name).
+            Locator for the username input field (by CSS).
 
         PASSWORD : tuple
             Locator for the password input field (by ID).
@@ -67,30 +67,30 @@ class StudentLoginLocators:
             Locator for the login submit button (by ID).
 
         ERROR_ALERT : tuple
-            Locator for error alert messages (by XPath).
+            Locator for error alert messages (by CSS).
 
         ACADEMIC_YEAR : tuple
-            Locator for selecting the academic year after login (by XPath).
+            Locator for selecting the academic year after login (by CSS).
 
         SCHOOL_INFO : tuple
-            Locator for closing the school information pop-up (by XPath).
+            Locator for closing the school information pop-up (by CSS).
 
         CURRENT_SCHOOL : tuple
             Locator for displaying the current school name after login
             (by XPath).
     """
 
-    USERNAME = (By.CLASS_NAME, StudentLoginSelectors.USERNAME_CLASS)
+    USERNAME = (By.CSS_SELECTOR, StudentLoginSelectors.USERNAME_CSS)
     PASSWORD = (By.ID, StudentLoginSelectors.PASSWORD_ID)
     CAPTCHA = (By.ID, StudentLoginSelectors.CAPTCHA_ID)
     SUBMIT_BUTTON = (By.ID, StudentLoginSelectors.SUBMIT_BUTTON_ID)
-    ERROR_ALERT = (By.XPATH, StudentLoginSelectors.ERROR_ALERT_XPATH)
+    ERROR_ALERT = (By.CSS_SELECTOR, StudentLoginSelectors.ERROR_ALERT_CSS)
 
     # Academic Choice Locators
-    ACADEMIC_YEAR = (By.XPATH, StudentLoginSelectors.AC_YEAR_XPATH)
+    ACADEMIC_YEAR = (By.CSS_SELECTOR, StudentLoginSelectors.AC_YEAR_CSS)
 
     # School Information Locators
-    SCHOOL_INFO = (By.XPATH, StudentLoginSelectors.SCHOOL_INFO_XPATH)
+    SCHOOL_INFO = (By.CSS_SELECTOR, StudentLoginSelectors.SCHOOL_INFO_CSS)
     CURRENT_SCHOOL = (By.XPATH, StudentLoginSelectors.CURRENT_SCHOOL_XPATH)
 
 
@@ -122,13 +122,13 @@ class StudentImportLocators:
         Locator for the 'Student Movement and Progression' option (by XPath).
 
     STUDENT_IMPORT_OPTION : tuple
-        Locator for the 'Student Import' module option (by XPath).
+        Locator for the 'Student Import' module option (by CSS).
 
     IN_STATE_IMPORT : tuple
-        Locator for the In-State Import option (by XPath).
+        Locator for the In-State Import option (by CSS).
 
     OUT_STATE_IMPORT : tuple
-        Locator for the Out-State Import option (by XPath).
+        Locator for the Out-State Import option (by CSS).
 
     STUDENT_PEN : tuple
         Locator for the Student PEN input field (by ID).
@@ -137,37 +137,37 @@ class StudentImportLocators:
         Locator for the Date of Birth input field (by ID).
 
     IMPORT_GO_BUTTON : tuple
-        Locator for the Import GO button (by XPath).
+        Locator for the Import GO button (by CSS).
 
     DOB_MISMATCH_MESSAGE : tuple
-        Locator for the DOB mismatch warning message (by XPath).
+        Locator for the DOB mismatch warning message (by CSS).
 
     DOB_MISMATCH_OK_BUTTON : tuple
-        Locator for the OK button in the DOB mismatch dialog (by XPath).
+        Locator for the OK button in the DOB mismatch dialog (by CSS).
 
     CURRENT_SCHOOL : tuple
         Locator for the current school display field (by XPath).
 
     STUDENT_STATUS : tuple
-        Locator for the student status field (by XPath).
+        Locator for the student status field (by CSS).
 
     SELECT_CLASS : tuple
-        Locator for the class selection dropdown (by XPath).
+        Locator for the class selection dropdown (by CSS).
 
     SELECT_SECTION : tuple
-        Locator for the section selection dropdown (by XPath).
+        Locator for the section selection dropdown (by CSS).
 
     DOA : tuple
         Locator for the Date of Admission input field (by XPath).
 
     IMPORT_BUTTON : tuple
-        Locator for the Import button (by XPath).
+        Locator for the Import button (by CSS).
 
     IMPORT_CONFIRM_BUTTON : tuple
-        Locator for the confirmation button in the import dialog (by XPath).
+        Locator for the confirmation button in the import dialog (by CSS).
 
     IMPORT_OK_BUTTON : tuple
-        Locator for the OK button after successful import (by XPath).
+        Locator for the OK button after successful import (by CSS).
 
     IMPORT_SUCCES_MESSAGE : tuple
         Locator for the success message displayed after import (by XPath).
@@ -178,32 +178,36 @@ class StudentImportLocators:
         StudentImportSelectors.MOVEMENT_PROGRESSION_XPATH,
     )
     STUDENT_IMPORT_OPTION = (
-        By.XPATH, StudentImportSelectors.IMPORT_OPTION_XPATH)
-    IN_STATE_IMPORT = (By.XPATH, StudentImportSelectors.IN_STATE_IMPORT_XPATH)
+        By.CSS_SELECTOR, StudentImportSelectors.IMPORT_OPTION_CSS)
+    IN_STATE_IMPORT = (
+        By.CSS_SELECTOR, StudentImportSelectors.IN_STATE_IMPORT_CSS)
     OUT_STATE_IMPORT = (
-        By.XPATH, StudentImportSelectors.OUT_STATE_IMPORT_XPATH)
+        By.CSS_SELECTOR, StudentImportSelectors.OUT_STATE_IMPORT_CSS)
     STUDENT_PEN = (By.ID, StudentImportSelectors.STUDENT_PEN_ID)
     DOB = (By.ID, StudentImportSelectors.DOB_ID)
     IMPORT_GO_BUTTON = (
-        By.XPATH, StudentImportSelectors.IMPORT_GO_BUTTON_XPATH)
+        By.CSS_SELECTOR, StudentImportSelectors.IMPORT_GO_BUTTON_CSS)
     DOB_MISMATCH_MESSAGE = (
-        By.XPATH, StudentImportSelectors.DOB_MISMATCH_MESSAGE_XPATH)
+        By.CSS_SELECTOR, StudentImportSelectors.DOB_MISMATCH_MESSAGE_CSS)
     DOB_MISMATCH_OK_BUTTON = (
-        By.XPATH,
-        StudentImportSelectors.DOB_MISMATCH_OK_BUTTON_XPATH,
+        By.CSS_SELECTOR,
+        StudentImportSelectors.DOB_MISMATCH_OK_BUTTON_CSS,
     )
     CURRENT_SCHOOL = (By.XPATH, StudentImportSelectors.CURRENT_SCHOOL_XPATH)
-    STUDENT_STATUS = (By.XPATH, StudentImportSelectors.STUDENT_STATUS_XPATH)
-    SELECT_CLASS = (By.XPATH, StudentImportSelectors.SELECT_CLASS_XPATH)
-    SELECT_SECTION = (By.XPATH, StudentImportSelectors.SELECT_SECTION_XPATH)
+    STUDENT_STATUS = (
+        By.CSS_SELECTOR, StudentImportSelectors.STUDENT_STATUS_CSS)
+    SELECT_CLASS = (By.CSS_SELECTOR, StudentImportSelectors.SELECT_CLASS_CSS)
+    SELECT_SECTION = (
+        By.CSS_SELECTOR, StudentImportSelectors.SELECT_SECTION_CSS)
     DOA = (By.XPATH, StudentImportSelectors.DOA_XPATH)
-    IMPORT_BUTTON = (By.XPATH, StudentImportSelectors.IMPORT_BUTTON_XPATH)
+    IMPORT_BUTTON = (
+        By.CSS_SELECTOR, StudentImportSelectors.IMPORT_BUTTON_CSS)
     IMPORT_CONFIRM_BUTTON = (
-        By.XPATH,
-        StudentImportSelectors.IMPORT_CONFIRM_BUTTON_XPATH,
+        By.CSS_SELECTOR,
+        StudentImportSelectors.IMPORT_CONFIRM_BUTTON_CSS,
     )
     IMPORT_OK_BUTTON = (
-        By.XPATH, StudentImportSelectors.IMPORT_OK_BUTTON_XPATH)
+        By.CSS_SELECTOR, StudentImportSelectors.IMPORT_OK_BUTTON_CSS)
     IMPORT_SUCCES_MESSAGE = (
         By.XPATH,
         StudentImportSelectors.IMPORT_SUCCES_MESSAGE_XPATH,
@@ -286,7 +290,7 @@ class ReleaseRequestLocators:
         By.XPATH, ReleaseRequestSelectors.OUT_STATE_RELEASE_REQUEST_XPATH)
     GENERATE_RELEASE_REQUEST = (
         By.XPATH, ReleaseRequestSelectors.GENERATE_RELEASE_REQUEST_XPATH)
-    STUDENT_PEN = (By.XPATH, ReleaseRequestSelectors.STUDENT_PEN_XPATH)
+    STUDENT_PEN = (By.CSS_SELECTOR, ReleaseRequestSelectors.STUDENT_PEN_CSS)
     DOB = (By.XPATH, ReleaseRequestSelectors.DOB_XPATH)
     GET_DETAILS_BUTTON = (
         By.XPATH, ReleaseRequestSelectors.GET_DETAILS_BUTTON_XPATH)
@@ -301,7 +305,7 @@ class ReleaseRequestLocators:
     GENERATE_REQUEST_BUTTON = (
         By.XPATH, ReleaseRequestSelectors.GENERATE_REQUEST_BUTTON_XPATH)
     REQUEST_STATUS_MESSAGE = (
-        By.XPATH, ReleaseRequestSelectors.REQUEST_STATUS_MESSAGE_XPATH)
+        By.CSS_SELECTOR, ReleaseRequestSelectors.REQUEST_STATUS_MESSAGE_CSS)
     OK_BUTTON = (
         By.XPATH, ReleaseRequestSelectors.OK_BUTTON_XPATH)
 
@@ -347,12 +351,12 @@ class SearchPENLocators:
         SearchPENSelectors.GET_PEN_AND_DOB_BUTTON_XPATH
     )
     AADHAAR_NO = (
-        By.XPATH,
-        SearchPENSelectors.AADHAAR_NO_XPATH
+        By.CSS_SELECTOR,
+        SearchPENSelectors.AADHAAR_NO_CSS
     )
     YEAR_OF_BIRTH = (
-        By.XPATH,
-        SearchPENSelectors.YEAR_OF_BIRTH_XPATH
+        By.CSS_SELECTOR,
+        SearchPENSelectors.YEAR_OF_BIRTH_CSS
     )
     SEARCH_BUTTON = (
         By.XPATH,
@@ -367,12 +371,12 @@ class SearchPENLocators:
         SearchPENSelectors.STUDENT_DOB_XPATH
     )
     ERROR_MESSAGE = (
-        By.XPATH,
-        SearchPENSelectors.ERROR_MESSAGE_XPATH
+        By.CSS_SELECTOR,
+        SearchPENSelectors.ERROR_MESSAGE_CSS
     )
     CLOSE_BUTTON = (
-        By.XPATH,
-        SearchPENSelectors.CLOSE_BUTTON_XPATH
+        By.CSS_SELECTOR,
+        SearchPENSelectors.CLOSE_BUTTON_CSS
     )
     ERROR_OK_BUTTON = (
         By.XPATH,
@@ -403,7 +407,7 @@ class StudentSectionShiftLocators:
         UPDATE_BUTTON: Locator for the Update button inside each table row.
         OK_BUTTON: Locator for the confirmation dialog OK button.
         STATUS_MESSAGE: Locator for the status or success message element.
-        TABLE_COLUMN: Locator for table column elements (tag-based).
+        TABLE_COLUMN: Locator for table column elements (by CSS).
         STUDENT_PEN_UI_ROW: Locator for the Student PEN cell within a
                             table row.
         STUDENT_SECTION_UI_ROW: Locator for the Student Section cell within a
@@ -418,19 +422,21 @@ class StudentSectionShiftLocators:
         By.XPATH, StudentSectionShiftSelectors.SELECT_SECTION_DROPDOWN_XPATH)
     GO_BUTTON = (By.XPATH, StudentSectionShiftSelectors.GO_BUTTON_XPATH)
     NEXT_PAGE_BUTTON = (
-        By.XPATH, StudentSectionShiftSelectors.NEXT_PAGE_BUTTON_XPATH)
+        By.CSS_SELECTOR, StudentSectionShiftSelectors.NEXT_PAGE_BUTTON_CSS)
     STUDENT_COUNT = (
-        By.XPATH, StudentSectionShiftSelectors.STUDENT_COUNT_XPATH)
+        By.CSS_SELECTOR, StudentSectionShiftSelectors.STUDENT_COUNT_CSS)
     SECTION_SHIFT_TABLE = (
-        By.XPATH, StudentSectionShiftSelectors.SECTION_SHIFT_TABLE_XPATH)
+        By.CSS_SELECTOR,
+        StudentSectionShiftSelectors.SECTION_SHIFT_TABLE_CSS)
     TABLE_ROW = (By.XPATH, StudentSectionShiftSelectors.TABLE_ROW_XPATH)
     NEW_SECTION = (By.XPATH, StudentSectionShiftSelectors.NEW_SECTION_XPATH)
     UPDATE_BUTTON = (
         By.XPATH, StudentSectionShiftSelectors.UPDATE_BUTTON_XPATH)
     OK_BUTTON = (By.XPATH, StudentSectionShiftSelectors.OK_BUTTON_XPATH)
     STATUS_MESSAGE = (
-        By.XPATH, StudentSectionShiftSelectors.STATUS_MESSAGE_XPATH)
-    TABLE_COLUMN = (By.TAG_NAME, StudentSectionShiftSelectors.TABLE_COLUMN_TAG)
+        By.CSS_SELECTOR, StudentSectionShiftSelectors.STATUS_MESSAGE_CSS)
+    TABLE_COLUMN = (
+        By.CSS_SELECTOR, StudentSectionShiftSelectors.TABLE_COLUMN_CSS)
     STUDENT_PEN_UI_ROW = (
         By.XPATH, StudentSectionShiftSelectors.STUDENT_PEN_UI_ROW_XPATH)
     STUDENT_SECTION_UI_ROW = (
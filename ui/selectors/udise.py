@@ -14,7 +14,7 @@ automation scripts.
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Date Created: 2025-08-19
-Last Modified: 2026-01-14
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
@@ -32,17 +32,19 @@ class StudentLoginSelectors:
 
     Attributes:
     -----------
-    XPath Selectors:
-        AC_YEAR_XPATH : str
-            XPath for selecting the academic year.
-        SCHOOL_INFO_XPATH : str
-            XPath for closing the school information pop-up.
-        ERROR_ALERT_XPATH : str
-            XPath for locating error alert messages.
+    CSS Selectors:
+        AC_YEAR_CSS : str
+            CSS selector for selecting the academic year.
+        SCHOOL_INFO_CSS : str
+            CSS selector for closing the school information pop-up.
+        ERROR_ALERT_CSS : str
+            CSS selector for locating error alert messages.
+        USERNAME_CSS : str
+            CSS selector for the username input field.
 
-    Class Name Selectors:
-        USERNAME_CLASS : str
-            Class name for the username input field.
+    XPath Selectors:
+        CURRENT_SCHOOL_XPATH : str
+            XPath for the current school name shown after login.
 
     ID Selectors:
         PASSWORD_ID : str
@@ -53,19 +55,21 @@ class StudentLoginSelectors:
             ID for the CAPTCHA input field.
     """
 
-    # Xpath selectors
+    # CSS selectors
+
+    AC_YEAR_CSS = "ul > li > div > div:nth-of-type(2) > p"  # Academic Choice
+    # School Information
+    SCHOOL_INFO_CSS = "div > div > div > div:nth-of-type(3) > button"
+    ERROR_ALERT_CSS = "div[role='alert'] > div > span"
+    # First form-control input on the login form
+    USERNAME_CSS = "input.form-control"
 
-    AC_YEAR_XPATH = "//ul/li/div/div[2]/p"  # Academic Choice
-    SCHOOL_INFO_XPATH = "//div/div/div/div[3]/button"  # School Information
-    ERROR_ALERT_XPATH = "//div[@role='alert']/div/span"
+    # XPath selectors
     CURRENT_SCHOOL_XPATH = (
         "//label[contains(normalize-space(text()), 'School Name')]"
         "/following::span[1]"
     )
 
-    # Class name selectors
-    USERNAME_CLASS = "form-control"
-
     # ID selectors
     PASSWORD_ID = "password-field"
     SUBMIT_BUTTON_ID = "submit-btn"
@@ -82,14 +86,14 @@ class StudentImportSelectors:
     XPath Selectors:
         MOVEMENT_PROGRESSION_XPATH : str
             XPath for the 'Student Movement and Progression' button.
-        IMPORT_OPTION_XPATH : str
-            XPath for the 'Student Import' option.
+        IMPORT_OPTION_CSS : str
+            CSS selector for the 'Student Import' option.
         FILE_UPLOAD_XPATH : str
             XPath for the file input element.
         SUBMIT_BUTTON_XPATH : str
             XPath for the import submission button.
-        STATUS_MESSAGE_XPATH : str
-            XPath for the status message display.
+        STATUS_MESSAGE_CSS : str
+            CSS selector for the status message display.
 
     ID Selectors:
         FILE_INPUT_ID : str
@@ -102,6 +106,9 @@ class StudentImportSelectors:
             CSS selector for the loading spinner.
         ERROR_MESSAGE_CSS : str
             CSS selector for error messages.
+        EXISTING_SCHOOL_CSS : str
+            CSS selector for the existing-school form list that holds the
+            class and section dropdowns.
 
     Name Selectors:
         FILE_FIELD_NAME : str
@@ -115,61 +122,49 @@ class StudentImportSelectors:
     # XPath selectors
     # MOVEMENT_PROGRESSION_XPATH = '//*[@id="collapseList"]/span'
     MOVEMENT_PROGRESSION_XPATH = (
-        "//span[contains(normalize-space(text()), "
-        "'Student Movement and Progression')]"
-        "/ancestor::button"
-    )
-    IMPORT_OPTION_XPATH = (
-        '//*[@id="flush-collapseOne2"]/div/ul/li[2]/span'
-    )
-    STATUS_MESSAGE_XPATH = (
-        "//div[@class='status-message']"
-    )
-    IN_STATE_IMPORT_XPATH = (
-        "//ul/li[1]/div/button"
+        "//span[normalize-space()='Student Movement and Progression']"
+        "/ancestor::button[1]"
     )
-    OUT_STATE_IMPORT_XPATH = (
-        "//ul/li[2]/div/button"
+    IMPORT_OPTION_CSS = (
+        "#flush-collapseOne2 > div > ul > li:nth-of-type(2) > span"
     )
-    IMPORT_GO_BUTTON_XPATH = (
-        "//div[@class='col-lg-8']/ul/li[3]/button"
+    STATUS_MESSAGE_CSS = "div[class='status-message']"
+    IN_STATE_IMPORT_CSS = "ul > li:nth-of-type(1) > div > button"
+    OUT_STATE_IMPORT_CSS = "ul > li:nth-of-type(2) > div > button"
+    IMPORT_GO_BUTTON_CSS = (
+        "div[class='col-lg-8'] > ul > li:nth-of-type(3) > button"
     )
-    DOB_MISMATCH_MESSAGE_XPATH = (
-        "//div[@role='dialog']/h2"
-    )
-    DOB_MISMATCH_OK_BUTTON_XPATH = (
-        "//div[@class='swal2-actions']/button[1]"
+    DOB_MISMATCH_MESSAGE_CSS = "div[role='dialog'] > h2"
+    DOB_MISMATCH_OK_BUTTON_CSS = (
+        "div[class='swal2-actions'] > button:nth-of-type(1)"
     )
     CURRENT_SCHOOL_XPATH = (
         "//span[contains(normalize-space(text()), "
         "'School Name')]/following-sibling::span"
     )
 
-    # XPath that matches either greenBack or redBack status container
-    STUDENT_STATUS_XPATH = (
-        "//*[contains(@class, 'greenBack') or "
-        "contains(@class, 'redBack')]"
-    )
-    SELECT_CLASS_XPATH = (
-        "//ul[@class='existingSchool1']/li[1]/div/select"
+    # Matches either the greenBack or redBack status container
+    STUDENT_STATUS_CSS = "[class*='greenBack'], [class*='redBack']"
+    # Class and section dropdowns share the existing-school form list
+    EXISTING_SCHOOL_CSS = "ul[class='existingSchool1']"
+    SELECT_CLASS_CSS = (
+        f"{EXISTING_SCHOOL_CSS} > li:nth-of-type(1) > div > select"
     )
-    SELECT_SECTION_XPATH = (
-        "//ul[@class='existingSchool1']/li[2]/div/ul/"
-        "li[1]/select"
+    SELECT_SECTION_CSS = (
+        f"{EXISTING_SCHOOL_CSS} > li:nth-of-type(2) > div > ul > "
+        "li:nth-of-type(1) > select"
     )
     DOA_XPATH = (
         "//label[contains(text(), 'Date of Admission')]"
         "/following::input[contains(@placeholder, 'DD/MM')][1]"
     )
-    IMPORT_BUTTON_XPATH = (
-        "//ul[@class='existingSchool1']/li[4]/button"
-    )
-    IMPORT_CONFIRM_BUTTON_XPATH = (
-        "//div[@class='swal2-actions']/button[3]"
+    IMPORT_BUTTON_CSS = (
+        "ul[class='existingSchool1'] > li:nth-of-type(4) > button"
     )
-    IMPORT_OK_BUTTON_XPATH = (
-        "//div[@class='swal2-actions']/button[1]"
+    IMPORT_CONFIRM_BUTTON_CSS = (
+        "div[class='swal2-actions'] > button:nth-of-type(3)"
     )
+    IMPORT_OK_BUTTON_CSS = "div[class='swal2-actions'] > button:nth-of-type(1)"
     IMPORT_SUCCES_MESSAGE_XPATH = (
         "//h2[contains(@class, 'swal2-title') and "
         "contains(normalize-space(text()), "
@@ -197,8 +192,8 @@ class ReleaseRequestSelectors:
             XPath for the 'Outside State' release request button.
         GENERATE_RELEASE_REQUEST_XPATH (str):
             XPath for the 'Generate Student Release Request' button or link.
-        STUDENT_PEN_XPATH (str):
-            XPath for the input field to enter the student's PEN.
+        STUDENT_PEN_CSS (str):
+            CSS selector for the input field to enter the student's PEN.
         DOB_XPATH (str):
             XPath for the 'Date of Birth' input field.
         GET_DETAILS_BUTTON_XPATH (str):
@@ -236,15 +231,13 @@ class ReleaseRequestSelectors:
         "//*[contains(normalize-space(text()), "
         "'Generate Student Release Request')]"
     )
-    STUDENT_PEN_XPATH = (
-        "//input[@placeholder='Enter PEN']"
-    )
+    STUDENT_PEN_CSS = "input[placeholder='Enter PEN']"
     DOB_XPATH = (
         "//label[contains(normalize-space(.), 'Date of Birth')]"
         "/following-sibling::div//input[@placeholder='DD/MM/YYYY']"
     )
     GET_DETAILS_BUTTON_XPATH = (
-        "//button[contains(normalize-space(text()), 'Get Details')]"
+        "//button[normalize-space()='Get Details']"
     )
     STUDENT_NAME_XPATH = (
         "//li[span[1][contains(text(), 'Student Name')]]/span[2]"
@@ -268,9 +261,9 @@ class ReleaseRequestSelectors:
     GENERATE_REQUEST_BUTTON_XPATH = (
         "//button[contains(normalize-space(text()), 'Generate')]"
     )
-    REQUEST_STATUS_MESSAGE_XPATH = "//div[@role='dialog']/h2"
+    REQUEST_STATUS_MESSAGE_CSS = "div[role='dialog'] > h2"
     OK_BUTTON_XPATH = (
-        "//button[contains(normalize-space(text()), 'Okay')]"
+        "//button[normalize-space()='Okay']"
     )
 
 
@@ -285,8 +278,8 @@ class SearchPENSelectors:
 
     Usage:
         driver.find_element(
-            By.XPATH,
-            SearchPENSelectors.AADHAAR_NO_XPATH
+            By.CSS_SELECTOR,
+            SearchPENSelectors.AADHAAR_NO_CSS
         ).send_keys("123456789012")
         driver.find_element(
             By.XPATH,
@@ -304,11 +297,11 @@ class SearchPENSelectors:
             XPath for the 'Get PEN' link or button.
             Anchored by visible text using normalize-space for whitespace
             tolerance.
-        AADHAAR_NO_XPATH (str):
-            XPath for the Aadhaar number input field.
+        AADHAAR_NO_CSS (str):
+            CSS selector for the Aadhaar number input field.
             Targets input by name attribute for schema resilience.
-        YEAR_OF_BIRTH_XPATH (str):
-            XPath for the date of birth input field.
+        YEAR_OF_BIRTH_CSS (str):
+            CSS selector for the date of birth input field.
             Uses name='dob' for consistent schema targeting.
         SEARCH_BUTTON_XPATH (str):
             XPath for the 'Search' button.
@@ -323,30 +316,30 @@ class SearchPENSelectors:
         STUDENT_DOB_XPATH (str):
             XPath for the first student's date of birth in the results table.
             Anchored to the 'DOB' header for resilient column targeting.
-        CLOSE_BUTTON_XPATH (str):
-            XPath for the 'Close' button in dialogs.
+        CLOSE_BUTTON_CSS (str):
+            CSS selector for the 'Close' button in dialogs.
             Uses ARIA label for accessibility and styling independence.
     """
     GET_PEN_AND_DOB_BUTTON_XPATH = (
         "//a[contains(normalize-space(text()), 'Get PEN')]"
     )
-    AADHAAR_NO_XPATH = "//input[@name='aadhaar']"
-    YEAR_OF_BIRTH_XPATH = "//input[@name='dob']"
+    AADHAAR_NO_CSS = "input[name='aadhaar']"
+    YEAR_OF_BIRTH_CSS = "input[name='dob']"
     SEARCH_BUTTON_XPATH = (
-        "//button[contains(normalize-space(text()), 'Search')]"
+        "//button[normalize-space()='Search']"
     )
-    ERROR_MESSAGE_XPATH = "//div[@role='dialog']/h2"
+    ERROR_MESSAGE_CSS = "div[role='dialog'] > h2"
     STUDENT_PEN_XPATH = (
         "//table//thead//th[normalize-space()='Student PEN']"
-        "/ancestor::table//tbody/tr[1]/td[1]"
+        "/ancestor::table[1]//tbody/tr[1]/td[1]"
     )
     STUDENT_DOB_XPATH = (
         "//table//thead//th[normalize-space()='DOB']"
-        "/ancestor::table//tbody/tr[1]/td[2]"
+        "/ancestor::table[1]//tbody/tr[1]/td[2]"
     )
-    CLOSE_BUTTON_XPATH = "//button[@aria-label='Close']"
+    CLOSE_BUTTON_CSS = "button[aria-label='Close']"
     ERROR_OK_BUTTON_XPATH = (
-        "//button[contains(normalize-space(text()),'Okay')]"
+        "//button[normalize-space()='Okay']"
     )
 
 
@@ -370,28 +363,28 @@ class StudentSectionShiftSelectors:
         XPath for the Section selection dropdown.
     GO_BUTTON_XPATH : str
         XPath for the 'Section Shift' Go button.
-    NEXT_PAGE_BUTTON_XPATH : str
-        XPath for the paginator Next button.
-    STUDENT_COUNT_XPATH : str
-        XPath for the element displaying total student count.
-    SECTION_SHIFT_TABLE_XPATH : tuple[str, str]
-        XPaths for locating the Section Shift data table container.
+    NEXT_PAGE_BUTTON_CSS : str
+        CSS selector for the paginator Next button.
+    STUDENT_COUNT_CSS : str
+        CSS selector for the element displaying total student count.
+    SECTION_SHIFT_TABLE_CSS : str
+        CSS selector for locating the Section Shift data table container.
     TABLE_ROW_XPATH : str
-        XPath for all table rows within the Section Shift table.
+        Relative XPath for all rows under the Section Shift table.
     NEW_SECTION_XPATH : str
         Relative XPath for the new Section dropdown inside each row.
     UPDATE_BUTTON_XPATH : str
         Relative XPath for the Update button inside each row.
     OK_BUTTON_XPATH : str
         XPath for the confirmation dialog OK button.
-    STATUS_MESSAGE_XPATH : str
-        XPath for the success message displayed after updating a section.
+    STATUS_MESSAGE_CSS : str
+        CSS selector for the message displayed after updating a section.
     STUDENT_PEN_UI_ROW_XPATH : str
         Relative XPath for the Student PEN cell within a table row.
     STUDENT_SECTION_UI_ROW_XPATH : str
         Relative XPath for the Student Section cell within a table row.
-    TABLE_COLUMN_TAG : str
-        Tag name used to identify table column elements.
+    TABLE_COLUMN_CSS : str
+        CSS selector for the data cells of a table row.
     """
 
     SECTION_SHIFT_OPTION_XPATH = (
@@ -405,17 +398,17 @@ class StudentSectionShiftSelectors:
         "/parent::li/following-sibling::li/select"
     )
     GO_BUTTON_XPATH = (
-        "//button[contains(normalize-space(text()), 'Go')]"
+        "//button[normalize-space()='Go']"
     )
-    NEXT_PAGE_BUTTON_XPATH = "//mat-paginator//button[2]//span[3]"
-    STUDENT_COUNT_XPATH = (
-        "//div[contains(@class,'mat-mdc-paginator-range-label')]"
+    NEXT_PAGE_BUTTON_CSS = (
+        "mat-paginator button:nth-of-type(2) span:nth-of-type(3)"
     )
-    SECTION_SHIFT_TABLE_XPATH = "//table[@role='table' and contains(@class,'mat-mdc-table')]"
-    TABLE_ROW_XPATH = "//tbody/tr"
+    STUDENT_COUNT_CSS = "div[class*='mat-mdc-paginator-range-label']"
+    SECTION_SHIFT_TABLE_CSS = "table[role='table'][class*='mat-mdc-table']"
+    TABLE_ROW_XPATH = ".//tbody/tr"
     NEW_SECTION_XPATH = "./td[5]/select"
     UPDATE_BUTTON_XPATH = "./td[6]/button[normalize-space()='Update']"
-    OK_BUTTON_XPATH = "//button[contains(normalize-space(text()), 'Okay')]"
+    OK_BUTTON_XPATH = "//button[normalize-space()='Okay']"
     '''
     STATUS_MESSAGE_XPATH = (
         "//h2[contains(@class, 'swal2-title') and "
@@ -423,12 +416,9 @@ class StudentSectionShiftSelectors:
         "'Section Successfully Updated')]"
     )
     '''
-    STATUS_MESSAGE_XPATH = (
-        "//h2[@id='swal2-title' or "
-        "contains(@class,'swal2-title')]"
-    )
+    STATUS_MESSAGE_CSS = "h2#swal2-title, h2[class*='swal2-title']"
     STUDENT_PEN_UI_ROW_XPATH = "./td[2]"
     STUDENT_SECTION_UI_ROW_XPATH = "./td[1]/ul/li[2]/span"
 
     # Tag selectors
-    TABLE_COLUMN_TAG = "td"
+    TABLE_COLUMN_CSS = "tr > td"
@@ -20,13 +20,14 @@ Features:
 
 Dependencies:
 -------------
-- time: for introducing delays between UI actions.
-- common.config.TIME_DELAY: configurable delay duration.
+- time: for tracking when the CAPTCHA input last changed.
+- selenium expected_conditions: event-driven waits for the login outcome.
 - common.logger.logger: logging utility for tracking actions.
 - common.driver.driver: WebDriver instance for browser interaction.
 - utils.utils.wait_and_click, wait_and_find_element: helper functions
     for UI interaction.
-- ui.locators.udise.StudentImportLocator: locator definitions for UI elements.
+- ui.locators.udise.StudentLoginLocators: locator definitions for UI
+    elements.
 - ui.udise.login: contains locator classes for academic year and
     school info elements.
 
@@ -39,18 +40,46 @@ and navigate through the initial setup steps required to access student data.
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Date Created: 2025-08-18
-Last Modified: 2025-10-15
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
 
 import time
 
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+
 from common.driver import WebDriverManager
 from common.logger import logger
 from ui.locators.udise import StudentLoginLocators
 from ui.ui_actions import UIActions as UI
 
+# Upper bound for the operator to type the CAPTCHA
+CAPTCHA_TIMEOUT = 120
+# The CAPTCHA counts as entered once the operator presses Enter in it, or
+# once its value has been stable this long
+CAPTCHA_SETTLE = 5.0
+# Upper bound for the school information dialog to close
+DIALOG_CLOSE_TIMEOUT = 5
+
+# Marks the CAPTCHA input in arguments[0] as done when the operator presses
+# Enter in it. The key press itself is swallowed so the form is only ever
+# submitted through the Submit button.
+_CAPTCHA_ENTER_SCRIPT = """
+const captcha = arguments[0];
+delete captcha.dataset.captchaDone;
+if (!captcha.dataset.captchaListener) {
+    captcha.dataset.captchaListener = '1';
+    captcha.addEventListener('keydown', function (event) {
+        if (event.key === 'Enter') {
+            event.preventDefault();
+            captcha.dataset.captchaDone = '1';
+        }
+    });
+}
+"""
+
 
 class StudentLogin:
     """
@@ -102,26 +131,19 @@ class StudentLogin:
         """
 
         logger.info("Starting login to UDISE Student Module")
-        field_data = [
-            (username, StudentLoginLocators.USERNAME),
-            (password, StudentLoginLocators.PASSWORD),
-        ]
 
         for attempt in range(1, max_attempts + 1):
             logger.debug("Login attempt %s/%s", attempt, max_attempts)
             # Fill credentials
-            UI.fill_fields(field_data)
+            self.fill_login_fields(username, password)
 
-            UI.wait_and_click(StudentLoginLocators.CAPTCHA)
-
-            logger.info("Waiting 15 seconds for manual CAPTCHA entry")
-            time.sleep(15)
+            self.wait_for_captcha()
 
+            previous_alert, submit_button = self._get_login_page_state()
             UI.wait_and_click(StudentLoginLocators.SUBMIT_BUTTON)
             logger.info("Clicked on the Submit button to initiate login")
 
-            # Give UI a moment to render any error messages
-            time.sleep(2)
+            self.wait_for_login_result(submit_button, previous_alert)
 
             if self.invalid_captcha():
                 logger.warning("Invalid CAPTCHA detected. Retrying login...")
@@ -135,7 +157,6 @@ class StudentLogin:
             # If no errors, assume login success
             logger.info(
                 "Login successful. Proceeding to academic year selection.")
-            time.sleep(2)
             UI.dismiss_browser_popup()
             self.select_academic_year()
             return
@@ -145,6 +166,117 @@ class StudentLogin:
             "Login failed after maximum attempts due to repeated CAPTCHA or credential errors."
         )
 
+    def fill_login_fields(self, username, password):
+        """
+        Fills the username and password fields.
+
+        Both are typed key by key through `UI.fill_fields`, so the login
+        form's own handlers see the input exactly as if it were typed.
+
+        Args:
+            username (str): The username to authenticate with.
+            password (str): The password associated with the username.
+
+        Raises:
+            ValueError: If the username or password is empty.
+        """
+        if not username or not password:
+            raise ValueError("Username and password are required for login")
+
+        UI.fill_fields([
+            (username, StudentLoginLocators.USERNAME),
+            (password, StudentLoginLocators.PASSWORD),
+        ])
+
+    def wait_for_captcha(self):
+        """
+        Waits for the operator to type the CAPTCHA.
+
+        The CAPTCHA input is cleared and focused, then polled until it holds
+        a non-empty value and the operator has pressed Enter in it, or the
+        value has not changed for CAPTCHA_SETTLE seconds. The settle time is
+        long enough that pausing while reading the image does not submit a
+        partial CAPTCHA.
+        If the operator has not finished within CAPTCHA_TIMEOUT seconds the
+        login is submitted anyway and the CAPTCHA check handles the retry.
+        """
+        captcha = UI.wait_and_find_element(StudentLoginLocators.CAPTCHA)
+        UI.clear_field(captcha)
+        captcha.click()
+        WebDriverManager.get_driver().execute_script(
+            _CAPTCHA_ENTER_SCRIPT, captcha)
+
+        state = {"value": "", "since": time.monotonic()}
+
+        def captcha_entered(_driver):
+            value = captcha.get_attribute("value") or ""
+            if not value:
+                return False
+            if captcha.get_attribute("data-captcha-done"):
+                return True
+            now = time.monotonic()
+            if value != state["value"]:
+                state["value"], state["since"] = value, now
+                return False
+            return now - state["since"] >= CAPTCHA_SETTLE
+
+        logger.info("Waiting for manual CAPTCHA entry (press Enter when done)")
+        try:
+            UI.wait_until(captcha_entered, timeout=CAPTCHA_TIMEOUT)
+            logger.debug("CAPTCHA entered")
+        except TimeoutException:
+            logger.warning(
+                "CAPTCHA not entered within %s seconds", CAPTCHA_TIMEOUT)
+
+    def _get_login_page_state(self):
+        """
+        Captures the login page elements that a login attempt replaces.
+
+        Returns:
+            tuple[WebElement | None, WebElement]: The error alert left by
+                the previous attempt (None if there is none) and the
+                Submit button of the login form.
+        """
+        driver = WebDriverManager.get_driver()
+        alerts = driver.find_elements(*StudentLoginLocators.ERROR_ALERT)
+        return (alerts[0] if alerts else None,
+                driver.find_element(*StudentLoginLocators.SUBMIT_BUTTON))
+
+    def wait_for_login_result(self, submit_button, previous_alert=None):
+        """
+        Waits until the login attempt has visibly succeeded or failed.
+
+        The error alert of the previous attempt is first waited on to go
+        stale, so it is never read as the outcome of this one. Then the
+        wait returns as soon as either a new error alert is shown or the
+        login form is gone; only in the latter case is the academic year
+        choice waited for, since its generic selector may already match on
+        the login page.
+
+        Args:
+            submit_button (WebElement): The login form's Submit button as
+                found before it was clicked.
+            previous_alert (WebElement, optional): Error alert shown before
+                the Submit button was clicked.
+        """
+        if previous_alert is not None:
+            try:
+                UI.wait_until(EC.staleness_of(previous_alert))
+            except TimeoutException:
+                logger.debug("Previous login error alert is still shown")
+        try:
+            # The alert condition yields the element, staleness yields True
+            if UI.wait_until(EC.any_of(
+                EC.visibility_of_element_located(
+                    StudentLoginLocators.ERROR_ALERT),
+                EC.staleness_of(submit_button),
+            )) is not True:
+                return
+            UI.wait_until(EC.presence_of_element_located(
+                StudentLoginLocators.ACADEMIC_YEAR))
+        except TimeoutException:
+            logger.warning("No login result rendered after submit")
+
     def get_logged_in_school(self):
         """
         Retrieves the name of the currently logged in school after login.
@@ -156,7 +288,7 @@ class StudentLogin:
             str: The name of the currently selected school.
         """
         school_name = UI.wait_and_find_element(
-            StudentLoginLocators.CURRENT_SCHOOL
+            StudentLoginLocators.CURRENT_SCHOOL, clickable=False
         ).get_attribute("innerHTML")
         logger.info("Current logged in school: %s", school_name)
         return school_name
@@ -181,6 +313,7 @@ class StudentLogin:
             None
         """
 
+        UI.wait_for_locator_js(StudentLoginLocators.ACADEMIC_YEAR)
         UI.wait_and_click(StudentLoginLocators.ACADEMIC_YEAR)
         logger.debug("Selected Current Academic Year")
 
@@ -209,31 +342,35 @@ class StudentLogin:
                         elements or UI issues.
         """
 
+        UI.wait_for_locator_js(StudentLoginLocators.SCHOOL_INFO)
         UI.wait_and_click(StudentLoginLocators.SCHOOL_INFO)
         logger.debug("Closed School Information dialog popup")
-        time.sleep(1)
+        try:
+            UI.wait_until(
+                EC.invisibility_of_element_located(
+                    StudentLoginLocators.SCHOOL_INFO),
+                timeout=DIALOG_CLOSE_TIMEOUT, poll_frequency=0.1)
+        except TimeoutException:
+            logger.debug("School Information dialog still visible")
 
     def invalid_captcha(self):
         """
         Checks whether the CAPTCHA validation message indicates
         an invalid input.
 
-        This function waits for the CAPTCHA message element to appear on the
-        student login page, retrieves its inner HTML content, and returns
-        True if the message contains the word "Invalid".
+        This function reads the error alert rendered on the student login
+        page after `wait_for_login_result`, retrieves its inner HTML
+        content, and returns True if the message contains the word
+        "Invalid".
 
         Returns:
             bool: True if the CAPTCHA message contains "Invalid",
                         False otherwise.
         """
-        driver = WebDriverManager.get_driver()
-        time.sleep(2)  # Give UI a moment to render error messages
-        elements = driver.find_elements(*StudentLoginLocators.ERROR_ALERT)
-        if elements:
-            msg = elements[0].get_attribute("innerHTML")
+        msg = self._get_error_alert()
+        if msg:
             logger.error("CAPTCHA error message: %s", msg)
-            return "Invalid" in msg if msg else False
-        return False
+        return "Invalid" in msg
 
     def incorrect_creds(self):
         """
@@ -248,11 +385,21 @@ class StudentLogin:
             bool: True if the message indicates incorrect credentials,
                     False otherwise.
         """
+        msg = self._get_error_alert()
+        if msg:
+            logger.error("Credential error message: %s", msg)
+        return "Incorrect" in msg
+
+    def _get_error_alert(self):
+        """
+        Returns the text of the login error alert, if one is shown.
+
+        Returns:
+            str: The alert's inner HTML, or an empty string if there is
+                no alert.
+        """
         driver = WebDriverManager.get_driver()
-        time.sleep(2)  # Give UI a moment to render error messages
         elements = driver.find_elements(*StudentLoginLocators.ERROR_ALERT)
-        if elements:
-            msg = elements[0].get_attribute("innerHTML")
-            logger.error("Credential error message: %s", msg)
-            return "Incorrect" in msg if msg else False
-        return False
+        if not elements:
+            return ""
+        return elements[0].get_attribute("innerHTML") or ""
@@ -18,23 +18,83 @@ Usage:
 Author: Ashish Namdev (ashish28 [at] sirt [dot] gmail [dot] com)
 
 Date Created:  2025-12-11
-Last Modified: 2026-01-20
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
 
+import json
 import time
 
 from selenium.common.exceptions import (ElementClickInterceptedException,
                                         NoSuchElementException,
+                                        StaleElementReferenceException,
                                         TimeoutException)
-from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select, WebDriverWait
 
 from common.config import CLASS, PAGE_SIZE, SECTIONS, TIME_DELAY
+from common.driver import WebDriverManager
 from common.logger import logger
 from ui.locators.udise import StudentSectionShiftLocators
 from ui.ui_actions import UIActions as UI
 
+# Reads the text of each row-relative XPath in arguments[2] from every row
+# matched by the XPath in arguments[1] under the table in arguments[0], so
+# the whole table is read in a single WebDriver round-trip. The result is
+# returned as one JSON string so Selenium does not walk every cell of the
+# response looking for element references.
+_TABLE_CELL_TEXT_SCRIPT = """
+const rows = document.evaluate(
+    arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+    null
+);
+const cells = arguments[2];
+const result = [];
+for (let i = 0; i < rows.snapshotLength; i++) {
+    const row = rows.snapshotItem(i);
+    result.push(cells.map(function (xpath) {
+        const node = document.evaluate(
+            xpath, row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        return node ? node.innerText.trim() : null;
+    }));
+}
+return JSON.stringify(result);
+"""
+
+# Returns [row, cell texts...] for the row at zero-based index arguments[2]
+# among the rows matched by the XPath in arguments[1] under the table in
+# arguments[0], reading the cells in arguments[3]; null if there is no such
+# row. Resolves and verifies a row in a single WebDriver round-trip.
+_TABLE_ROW_SCRIPT = """
+const rows = document.evaluate(
+    arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+    null
+);
+const row = rows.snapshotItem(arguments[2]);
+if (!row) {
+    return null;
+}
+return [row].concat(arguments[3].map(function (xpath) {
+    const node = document.evaluate(
+        xpath, row, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return node ? node.innerText.trim() : null;
+}));
+"""
+
+# Returns [first row matched by the XPath in arguments[0], trimmed text of
+# the element matched by the CSS selector in arguments[1]] without
+# marshalling every row of the page into a WebElement.
+_PAGE_MARKER_SCRIPT = """
+const row = document.evaluate(
+    arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+const label = document.querySelector(arguments[1]);
+return [row, label ? label.innerText.trim() : null];
+"""
+
 
 class StudentSectionShiftUI:
     """
@@ -51,6 +111,34 @@ class StudentSectionShiftUI:
         reliable execution.
     """
 
+    def __init__(self):
+        """
+        Initializes the Section Shift UI handler.
+
+        The driver session starts with the implicit wait disabled. The
+        row lookups here use `find_elements` to probe for rows that may
+        legitimately be missing, and those must return at once instead of
+        stalling on the implicit-wait timeout. Every wait is an explicit
+        one instead.
+
+        Attributes:
+            _driver (WebDriver): The shared driver, resolved once for the
+                per-row script calls.
+            _wait (WebDriverWait): Wait used to detect when the page has
+                settled after a dialog or page change. Its timeout is
+                TIME_DELAY, so a missed condition costs no more than the
+                fixed delay it replaces.
+            _table (WebElement or None): The section shift data table,
+                cached until the class or page changes.
+            _row_index (dict[str, int]): Row position of each PEN as of the
+                latest table snapshot.
+        """
+        self._driver = WebDriverManager.get_driver()
+        self._wait = WebDriverWait(
+            self._driver, TIME_DELAY, poll_frequency=0.25)
+        self._table = None
+        self._row_index = {}
+
     def select_section_shift_options(self, select_class=True):
         """
         Opens the 'Class / Section Shift' option in the UDISE Student Module UI.
@@ -104,6 +192,8 @@ class StudentSectionShiftUI:
 
         class_to_select = class_to_select if class_to_select else CLASS
         logger.debug("Selecting Section Shift Class: %s", class_to_select)
+        self._table = None
+        self._row_index = {}
         try:
             UI.refresh_page()
 
@@ -172,83 +262,134 @@ class StudentSectionShiftUI:
         """
         Retrieves the section shift data table element from the UI.
 
+        The element is cached until the class or page changes; a cached
+        table that has gone stale is resolved again.
+
         Returns:
             WebElement: The section shift data table element.
         Raises:
             TimeoutException: If the table element is not found
                                 within the wait period.
         """
+        if self._table is not None:
+            try:
+                self._table.is_enabled()  # cheap liveness probe
+                return self._table
+            except StaleElementReferenceException:
+                logger.debug("Cached section shift table went stale")
+
         try:
-            table = UI.wait_and_find_element(
+            self._table = UI.wait_and_find_element(
                 StudentSectionShiftLocators.SECTION_SHIFT_TABLE)
             logger.debug("Section shift data table retrieved successfully.")
-            return table
+            return self._table
         except TimeoutException as e:
             logger.error("Failed to locate section shift data table: %s", e)
             raise
 
-    def get_section_shift_table_rows(self, table):
+    def snapshot_section_shift_rows(self):
         """
-        Retrieve all row elements from the section shift data table.
+        Reads the PEN and Section of every row in the section shift table
+        with a single script call.
 
-        Args:
-            table (WebElement): The table element containing student rows.
+        The rows are read from the (cached) table element, so the script
+        only walks that table. The rows render after the table itself, so
+        they are waited for before the script runs. Rows without a PEN
+        cell (e.g. a "no data" placeholder row) are left out.
 
         Returns:
-            List[WebElement]: A list of row elements in the table.
-        """
-        rows = UI.wait_and_find_elements(
-            StudentSectionShiftLocators.TABLE_ROW, table)
-        if not rows:
-            logger.warning("No rows found in section shift data table.")
-        else:
-            logger.debug(
-                "Retrieved %d rows from section shift data table.", len(rows))
-        return rows
+            list[tuple[int, str, str]]: (row index, PEN, Section) for each
+                student row, where the index can be passed to
+                `get_section_shift_row` to resolve the row element.
 
-    def get_ui_student_pen_and_section(self, student_row):
+        Raises:
+            TimeoutException: If no rows render within the wait period.
         """
-        Retrieves the Permanent Enrollment Number (PEN)
-        and Section of a student from the given table row.
-
-        Args:
-            student_row (WebElement): The table row element for the student.
-        Returns:
-            tuple: A tuple containing the student's PEN and Section.
+        table = self.get_section_shift_data_table()
+        UI.wait_and_find_elements(StudentSectionShiftLocators.TABLE_ROW, table)
+        cells = json.loads(self._driver.execute_script(
+            _TABLE_CELL_TEXT_SCRIPT,
+            table,
+            StudentSectionShiftLocators.TABLE_ROW[1],
+            [StudentSectionShiftLocators.STUDENT_PEN_UI_ROW[1],
+             StudentSectionShiftLocators.STUDENT_SECTION_UI_ROW[1]]))
+        snapshot = [
+            (index, pen, section)
+            for index, (pen, section) in enumerate(cells)
+            if pen
+        ]
+        self._row_index = {pen: index for index, pen, _ in snapshot}
+        logger.debug("Read %d rows from section shift data table.",
+                     len(snapshot))
+        return snapshot
+
+    def get_section_shift_row(self, row_index, student_pen):
         """
-        return (
-            self._get_ui_student_pen(student_row),
-            self._get_ui_student_section(student_row)
-        )
+        Resolves the row element for a student in the section shift table.
 
-    def _get_ui_student_pen(self, student_row):
-        """
-        Retrieves the Permanent Enrollment Number (PEN)
-        of a student from the given table row.
+        Only the one row element is resolved, together with its PEN in the
+        same script call; the rest of the table is never materialised. The
+        row at `row_index` is used if it still holds
+        `student_pen`, otherwise the position recorded by the latest
+        snapshot is tried. Only if neither matches (the table re-rendered
+        since it was last read, e.g. after an earlier shift) is the table
+        read again, and that snapshot then serves the following rows too.
 
         Args:
-            student_row (WebElement): The table row element for the student.
+            row_index (int): Row index as returned by
+                `snapshot_section_shift_rows`.
+            student_pen (str): PEN the row is expected to hold.
 
         Returns:
-            str: The student's Permanent Enrollment Number (PEN).
+            WebElement or None: The table row element, or None if no row
+                holds the PEN any more.
         """
-        return UI.wait_and_find_element(
-            StudentSectionShiftLocators.STUDENT_PEN_UI_ROW, student_row
-        ).text.strip()
-
-    def _get_ui_student_section(self, student_row):
+        for index in dict.fromkeys(
+                (row_index, self._row_index.get(student_pen, row_index))):
+            row, pen = self._get_table_row(index)
+            if row is not None and pen == student_pen:
+                return row
+
+        logger.debug("Row %d no longer holds PEN %s, re-reading table",
+                     row_index, student_pen)
+        self.snapshot_section_shift_rows()
+        if student_pen in self._row_index:
+            return self._get_table_row(self._row_index[student_pen])[0]
+
+        logger.warning("PEN %s not found in section shift table",
+                       student_pen)
+        return None
+
+    def _get_table_row(self, row_index):
         """
-        Retrieves the Section of a student from the
-        given table row.
+        Returns the single row element at `row_index` in the cached data
+        table, along with the PEN it holds.
+
+        If the table goes stale between the liveness probe and the row
+        lookup, it is resolved again and the lookup retried once.
 
         Args:
-            student_row (WebElement): The table row element for the student.
+            row_index (int): Zero-based row position.
+
         Returns:
-            str: The student's Section.
+            tuple[WebElement | None, str | None]: The row element and its
+                PEN, or (None, None) if the table has fewer rows.
         """
-        return UI.wait_and_find_element(
-            StudentSectionShiftLocators.STUDENT_SECTION_UI_ROW, student_row
-        ).text.strip()
+        args = (
+            StudentSectionShiftLocators.TABLE_ROW[1],
+            row_index,
+            [StudentSectionShiftLocators.STUDENT_PEN_UI_ROW[1]],
+        )
+        try:
+            result = self._driver.execute_script(
+                _TABLE_ROW_SCRIPT, self.get_section_shift_data_table(), *args)
+        except StaleElementReferenceException:
+            self._table = None
+            result = self._driver.execute_script(
+                _TABLE_ROW_SCRIPT, self.get_section_shift_data_table(), *args)
+        if not result:
+            return None, None
+        return result[0], result[1]
 
     def shift_section(self, student_pen, section, student_row):
         """
@@ -268,10 +409,8 @@ class StudentSectionShiftUI:
             logger.info("Shifting Student PEN No: %s to Section: %s",
                         student_pen, section)
             self._select_new_section(section, student_row)
-
-            logger.debug("Waiting for %s seconds", TIME_DELAY / 3)
-            time.sleep(TIME_DELAY / 3)
-
+            # wait_and_click waits for the Update button to be clickable,
+            # so no fixed pause is needed after the selection
             self._update_section(student_row)
         except ValueError as ve:
             logger.warning(
@@ -325,7 +464,6 @@ class StudentSectionShiftUI:
             raise
 
         logger.info("Selected New Section: %s", section)
-        time.sleep(TIME_DELAY / 3)
 
     def _update_section(self, student_row):
         """
@@ -411,6 +549,10 @@ class StudentSectionShiftUI:
         try:
             UI.wait_and_click(StudentSectionShiftLocators.OK_BUTTON)
             logger.debug("Clicked OK button to confirm section shift.")
+            self._wait_for(
+                EC.invisibility_of_element_located(
+                    StudentSectionShiftLocators.STATUS_MESSAGE),
+                "section shift dialog to close")
         except TimeoutException as e:
             logger.error(
                 "Failed to locate OK button for section shift confirmation: %s", e)
@@ -432,7 +574,26 @@ class StudentSectionShiftUI:
         """
         try:
             logger.debug("Attempting to navigate to the next page...")
+            first_row, range_text = self._driver.execute_script(
+                _PAGE_MARKER_SCRIPT,
+                StudentSectionShiftLocators.TABLE_ROW[1],
+                StudentSectionShiftLocators.STUDENT_COUNT[1])
             UI.wait_and_click(StudentSectionShiftLocators.NEXT_PAGE_BUTTON)
+            self._table = None
+            self._row_index = {}
+            if range_text is not None:
+                self._wait_for(
+                    lambda d: d.find_element(
+                        *StudentSectionShiftLocators.STUDENT_COUNT
+                    ).text.strip() != range_text,
+                    "paginator range label to change")
+            if first_row is not None:
+                self._wait_for(EC.staleness_of(first_row),
+                               "previous page rows to detach")
+            self._wait_for(
+                EC.presence_of_element_located(
+                    StudentSectionShiftLocators.TABLE_ROW),
+                "next page rows to render")
             logger.info("Successfully navigated to the next page.")
         except TimeoutException as e:
             logger.error("Next Page button not found: %s", e)
@@ -440,3 +601,21 @@ class StudentSectionShiftUI:
         except ElementClickInterceptedException as e:
             logger.error("Next Page button not clickable: %s", e)
             raise
+
+    def _wait_for(self, condition, description):
+        """
+        Waits for a page-settle condition without failing the workflow.
+
+        Args:
+            condition (Callable): An `expected_conditions` predicate.
+            description (str): What is being waited for, used in logs.
+
+        Returns:
+            bool: True if the condition was met, False if the wait timed out.
+        """
+        try:
+            self._wait.until(condition)
+            return True
+        except TimeoutException:
+            logger.debug("Timed out waiting for %s", description)
+            return False
@@ -7,8 +7,7 @@ import options such as Student Movement and Progression, and initiate
 the student import process via predefined UI locators.
 
 Dependencies:
-- time: for introducing delays between UI actions
-- common.config.TIME_DELAY: configurable delay duration
+- selenium WebDriverWait: explicit waits tuned per call site
 - common.logger.logger: logging utility for tracking actions
 - utils.utils.wait_and_click: helper function to interact with UI elements
 - ui.locators.udise.StudentImportLocators: locator definitions for UI elements
@@ -16,20 +15,32 @@ Dependencies:
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Date Created: 2025-08-19
-Last Modified: 2025-10-15
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
 
-import time
+from contextlib import contextmanager
 
-from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select, WebDriverWait
 
-from common.config import SECTIONS, TIME_DELAY
+from common.config import SECTIONS, TIMEOUT
+from common.driver import WebDriverManager
 from common.logger import logger
 from ui.locators.udise import StudentImportLocators
 from ui.ui_actions import UIActions as UI
 
+# Elements of the student details section, which is re-rendered for every
+# PEN/DOB lookup; the search form above it stays cached across students
+_STUDENT_DETAIL_LOCATORS = (
+    StudentImportLocators.SELECT_CLASS,
+    StudentImportLocators.SELECT_SECTION,
+    StudentImportLocators.STUDENT_STATUS,
+    StudentImportLocators.CURRENT_SCHOOL,
+)
+
 
 class StudentImportUI:
     """
@@ -43,8 +54,51 @@ class StudentImportUI:
         Student Import module.
         Includes logging and configurable delays to ensure
         reliable execution.
+
+    begin_student(pen_no):
+        Context manager scoping the cached student details elements to a
+        single student so they are reused within, but never across,
+        students.
     """
 
+    def __init__(self):
+        """
+        Initializes the StudentImportUI with an explicit-wait policy.
+
+        The driver session starts with the implicit wait disabled, so
+        negative lookups (e.g. "is there a DOB error dialog?") return
+        immediately instead of paying the implicit-wait floor; every wait
+        is an explicit one instead.
+
+        Attributes:
+            _fast_wait (WebDriverWait): Short, fast-polling wait for dialogs
+                that are either already rendered or absent.
+            _nav_wait (WebDriverWait): Longer wait for the page to respond
+                to a form submission.
+        """
+        driver = WebDriverManager.get_driver()
+        self._fast_wait = WebDriverWait(driver, 0.5, poll_frequency=0.1)
+        self._nav_wait = WebDriverWait(driver, TIMEOUT)
+
+    @contextmanager
+    def begin_student(self, pen_no):
+        """
+        Scopes the cached student details elements to a single student.
+
+        The details elements are dropped from the `UI.find_cached` cache on
+        entry and on exit so WebElements resolved for one student never
+        bleed into the next one.
+
+        Args:
+            pen_no (str): The student's PEN number, used for logging.
+        """
+        UI.invalidate_cache(*_STUDENT_DETAIL_LOCATORS)
+        logger.debug("Element cache reset for student %s", pen_no)
+        try:
+            yield self
+        finally:
+            UI.invalidate_cache(*_STUDENT_DETAIL_LOCATORS)
+
     def select_import_options(self):
         """
         Selects key import options in the UDISE Student Module UI.
@@ -54,7 +108,7 @@ class StudentImportUI:
         - Clicks on 'Import Module'
         - Clicks on 'Import Within State'
 
-        Each step includes logging and a delay to ensure UI stability.
+        Each step waits for its menu item to be attached before clicking.
 
         Raises:
             TimeoutException if any element is not clickable
@@ -69,11 +123,11 @@ class StudentImportUI:
             ("Import Within State", StudentImportLocators.IN_STATE_IMPORT),
         ]
 
+        UI.invalidate_cache()
         for msg, locator in locators:
+            UI.wait_for_locator_js(locator)
             UI.wait_and_click(locator)
             logger.info("Selected %s option", msg)
-            # logger.debug("waiting for %s seconds", TIME_DELAY)
-            # time.sleep(TIME_DELAY)
 
     def import_student(self, student_pen, dob):
         """
@@ -89,24 +143,79 @@ class StudentImportUI:
             - Logs debug and info messages.
             - Clicks the import button and waits for UI transition.
         """
+        # A new PEN/DOB lookup re-renders the details section
+        UI.invalidate_cache(*_STUDENT_DETAIL_LOCATORS)
         try:
             field_data = [
                 (student_pen, StudentImportLocators.STUDENT_PEN),
                 (dob, StudentImportLocators.DOB),
             ]
-            UI.fill_fields(field_data)
+            # The search form stays on the page from one student to the next
+            UI.fill_fields(field_data, cached=True)
 
             logger.info("Student PEN No: %s, DOB: %s", student_pen, dob)
 
-            UI.wait_and_click(StudentImportLocators.IMPORT_GO_BUTTON)
+            previous = self._get_previous_result()
+            UI.wait_and_click(StudentImportLocators.IMPORT_GO_BUTTON,
+                              cached=True)
             logger.debug("Clicked Import button")
-            logger.debug("Waiting for %s seconds", TIME_DELAY)
-            time.sleep(TIME_DELAY)
+            self._wait_for_import_result(previous)
         except ValueError as ve:
             logger.warning("Validation error during student import: %s", ve)
         except Exception as e:
             logger.error("Unexpected error during student import: %s", e)
 
+    def _get_previous_result(self):
+        """
+        Returns the student status container left over from the previous
+        lookup, if any.
+
+        The container of a student who took the "active / already in
+        school" path stays in the DOM, so it must be replaced before a
+        status is read for the next student.
+
+        Returns:
+            WebElement or None: The existing status container, or None if
+                there is none.
+        """
+        elements = WebDriverManager.get_driver().find_elements(
+            *StudentImportLocators.STUDENT_STATUS)
+        return elements[0] if elements else None
+
+    def _wait_for_import_result(self, previous=None):
+        """
+        Waits until the portal responds to the PEN/DOB lookup, i.e. until
+        either the DOB mismatch dialog or the student status container is
+        present in the DOM.
+
+        If a status container from the previous lookup was present, it is
+        first waited on to go stale (or for the DOB mismatch dialog) so the
+        previous student's status is never mistaken for the new one.
+
+        A timeout is logged and swallowed; `get_pen_status()` reports
+        'none' in that case.
+
+        Args:
+            previous (WebElement, optional): Status container present
+                before the lookup was submitted.
+        """
+        try:
+            if previous is not None:
+                # A DOB mismatch may leave the old container in place
+                self._nav_wait.until(EC.any_of(
+                    EC.staleness_of(previous),
+                    EC.presence_of_element_located(
+                        StudentImportLocators.DOB_MISMATCH_MESSAGE),
+                ))
+            self._nav_wait.until(EC.any_of(
+                EC.presence_of_element_located(
+                    StudentImportLocators.DOB_MISMATCH_MESSAGE),
+                EC.presence_of_element_located(
+                    StudentImportLocators.STUDENT_STATUS),
+            ))
+        except TimeoutException:
+            logger.warning("No response from import lookup within wait period")
+
     def submit_import_data(self, student_class, section, doa):
         """
         Fills and submits the student import form with specified class,
@@ -131,12 +240,14 @@ class StudentImportUI:
             - `wait_and_find_element()` and `wait_and_click()` are
                 utility functions that handle element presence and interaction.
         """
+        # The class dropdown was usually resolved by get_import_class
+        # already for the class mismatch check
         for value, locator in [
             (student_class, StudentImportLocators.SELECT_CLASS),
             (SECTIONS[section], StudentImportLocators.SELECT_SECTION),
         ]:
             logger.debug("Selecting value %s for %s", value, locator)
-            Select(UI.wait_and_find_element(locator)).select_by_value(value)
+            Select(UI.find_cached(locator)).select_by_value(value)
 
         UI.fill_fields([(doa, StudentImportLocators.DOA)])
         logger.debug("Entered Date of Admission: %s", doa)
@@ -188,8 +299,9 @@ class StudentImportUI:
             This method assumes that the import flow has already been
             completed and the success message is visible in the DOM.
         """
-        import_message = UI.wait_and_find_element(
-            StudentImportLocators.IMPORT_SUCCES_MESSAGE
+        import_message = self._nav_wait.until(
+            EC.presence_of_element_located(
+                StudentImportLocators.IMPORT_SUCCES_MESSAGE)
         ).get_attribute("innerHTML")
         logger.info("Import Success Message: %s", import_message)
 
@@ -217,6 +329,7 @@ class StudentImportUI:
                 "success": StudentImportLocators.STUDENT_STATUS,
             },
             timeout=12,
+            poll_frequency=0.1,
         )
 
     def get_ui_dob_status(self):
@@ -229,20 +342,29 @@ class StudentImportUI:
         expected value during student import validation.
 
         Returns:
-            str: The inner HTML content of the DOB mismatch message element.
+            str | None: The inner HTML content of the DOB mismatch message
+                element, or None if no DOB mismatch dialog is shown.
 
         Raises:
-            NoSuchElementException: If the locator is not found on the page.
             WebDriverException: For general Selenium interaction failures.
         """
-        dob_error_msg = UI.wait_and_find_element(
-            StudentImportLocators.DOB_MISMATCH_MESSAGE
-        ).get_attribute("innerHTML")
+        try:
+            dob_error_msg = self._fast_wait.until(
+                EC.presence_of_element_located(
+                    StudentImportLocators.DOB_MISMATCH_MESSAGE)
+            ).get_attribute("innerHTML")
+        except TimeoutException:
+            logger.debug("No DOB mismatch dialog present")
+            return None
         logger.debug("DOB Mismatch Message: %s", dob_error_msg)
 
         UI.wait_and_click(StudentImportLocators.DOB_MISMATCH_OK_BUTTON)
         logger.debug("Clicked OK button on DOB mismatch dialog")
-        time.sleep(2)
+        try:
+            self._nav_wait.until(EC.invisibility_of_element_located(
+                StudentImportLocators.DOB_MISMATCH_MESSAGE))
+        except TimeoutException:
+            logger.warning("DOB mismatch dialog still visible after OK")
 
         return dob_error_msg
 
@@ -266,7 +388,7 @@ class StudentImportUI:
         }
 
         try:
-            status_element = UI.wait_and_find_element(
+            status_element = UI.find_cached(
                 StudentImportLocators.STUDENT_STATUS)
             class_name = status_element.get_attribute("class") or ""
             if "greenBack" in class_name:
@@ -288,11 +410,12 @@ class StudentImportUI:
         school's name and returns its text content.
 
         Returns:
-            str: The name of the currently selected school.
+            str: The name of the currently selected school, stripped of
+                 surrounding whitespace.
         """
-        school_name = UI.wait_and_find_element(
+        school_name = UI.find_cached(
             StudentImportLocators.CURRENT_SCHOOL
-        ).get_attribute("innerHTML")
+        ).get_attribute("innerHTML").strip()
         logger.debug("Student's Current school : %s", school_name)
         return school_name
 
@@ -307,7 +430,7 @@ class StudentImportUI:
             str: The value of the currently selected class.
         """
         class_value = Select(
-            UI.wait_and_find_element(StudentImportLocators.SELECT_CLASS)
+            UI.find_cached(StudentImportLocators.SELECT_CLASS)
         ).first_selected_option.get_attribute("value")
         logger.debug("Currently selected import class : %s", class_value)
         return class_value
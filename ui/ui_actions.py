@@ -27,11 +27,12 @@ Intended for use in AutoEdu workflows and other scalable automation platforms.
 Author: Ashish Namdev (ashish28 [dot] sirt [at] gmail [dot] com)
 
 Date Created: 2025-08-18
-Last Modified: 2026-01-20
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
 
+import random
 import time
 
 from selenium.common.exceptions import (ElementClickInterceptedException,
@@ -39,6 +40,7 @@ from selenium.common.exceptions import (ElementClickInterceptedException,
                                         StaleElementReferenceException,
                                         TimeoutException)
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
@@ -48,6 +50,51 @@ from common.config import TIMEOUT
 from common.driver import WebDriverManager
 from common.logger import logger
 
+# Bound once so hot wait paths skip the attribute lookup on EC
+_clickable = EC.element_to_be_clickable
+_present = EC.presence_of_element_located
+_present_all = EC.presence_of_all_elements_located
+
+# Seconds between condition checks; Selenium's default of 0.5 s adds on
+# average a quarter second to every wait on elements that render quickly
+POLL_FREQUENCY = 0.15
+
+# Resolves with true as soon as the node exists, or false after the timeout.
+# Arguments: (xpath or null, css or null, timeout ms, callback)
+_WAIT_FOR_NODE_SCRIPT = """
+const [xpath, css, timeoutMs, done] = arguments;
+const find = () => xpath
+    ? document.evaluate(xpath, document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(css);
+if (find()) { done(true); return; }
+const observer = new MutationObserver(() => {
+    if (find()) { observer.disconnect(); clearTimeout(timer); done(true); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(false); },
+                         timeoutMs);
+observer.observe(document.documentElement,
+                 {childList: true, subtree: true, attributes: true});
+"""
+
+# Sets an input's value and fires the events a typed value would
+_SET_VALUE_SCRIPT = """
+const [el, value] = arguments;
+el.focus();
+el.value = value;
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.value;
+"""
+
+# CSS equivalents for the non-XPath strategies used by the locators
+_CSS_FORMATS = {
+    By.CSS_SELECTOR: "{}",
+    By.ID: "#{}",
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
 
 class UIActions:
     """
@@ -65,17 +112,36 @@ class UIActions:
             Waits for an element to be clickable and clicks it,
             retrying if necessary.
 
-        wait_and_find_element(locator):
-            Waits for a single element to be present and returns it.
+        wait_and_find_element(locator, clickable=True):
+            Waits for a single element to be clickable (or only present)
+            and returns it.
 
         wait_and_find_elements(locator):
             Waits for multiple elements matching the locator and returns them.
 
-        wait_for_first_match(locators, timeout=10):
+        wait_until(condition, timeout=TIMEOUT, poll_frequency=POLL_FREQUENCY):
+            Polls a WebDriverWait condition and returns its result.
+
+        wait_for_locator_js(locator, timeout=TIMEOUT):
+            Waits in the browser, via a MutationObserver, for an element
+            matching the locator to be attached.
+
+        wait_for_first_match(locators, timeout=10, poll_frequency=0.5):
             Waits for the first matching locator from a list and returns
             the element.
 
-        fill_fields(field_data):
+        find_cached(locator):
+            Returns a clickable element, reusing it across calls while it
+            stays attached.
+
+        invalidate_cache(*locators):
+            Drops the given (or all) elements cached by find_cached.
+
+        fast_type(element, text):
+            Sets an input's value with one script call instead of per-key
+            events.
+
+        fill_fields(field_data, cached=False, fast=False):
             Fills multiple fields using a dictionary of locator-value pairs.
 
         clear_field(element):
@@ -96,14 +162,92 @@ class UIActions:
         UIActions.fill_fields((username, StudentLoginLocators.USERNAME))
     """
 
+    _wait = None
+    _wait_driver = None
+    _element_cache = {}
+
+    @classmethod
+    def _get_wait(cls, parent_element=None):
+        """
+        Returns a WebDriverWait with the default TIMEOUT.
+
+        The wait on the shared driver is built once and reused; it is rebuilt
+        only if WebDriverManager hands out a different driver. Waits scoped
+        to a parent element are created per call.
+
+        Args:
+            parent_element (WebElement, optional): Element to wait within.
+                Defaults to None, meaning the shared driver.
+
+        Returns:
+            WebDriverWait: The wait to call `until` on.
+        """
+        if parent_element is not None:
+            return WebDriverWait(
+                parent_element, TIMEOUT, poll_frequency=POLL_FREQUENCY)
+        driver = WebDriverManager.get_driver()
+        if cls._wait is None or cls._wait_driver is not driver:
+            cls._wait = WebDriverWait(
+                driver, TIMEOUT, poll_frequency=POLL_FREQUENCY)
+            cls._wait_driver = driver
+        return cls._wait
+
     @classmethod
-    def wait_and_click(cls, locator, retries=2, parent_element=None):
+    def find_cached(cls, locator):
+        """
+        Returns the clickable element for a locator, reusing the element
+        resolved by an earlier call.
+
+        Meant for controls that stay on the page across iterations, such as
+        a search form used once per student. A cached element is reused only
+        while it is still attached and displayed; otherwise the locator is
+        resolved again through `wait_and_find_element`.
+
+        Args:
+            locator (tuple): Locator tuple; also the cache key.
+
+        Returns:
+            WebElement: The resolved element.
+        """
+        element = cls._element_cache.get(locator)
+        if element is not None:
+            try:
+                if element.is_displayed():
+                    return element
+            except StaleElementReferenceException:
+                logger.debug("Cached element went stale: %s", locator)
+
+        element = cls.wait_and_find_element(locator)
+        cls._element_cache[locator] = element
+        return element
+
+    @classmethod
+    def invalidate_cache(cls, *locators):
+        """
+        Drops elements cached by `find_cached`.
+
+        Call after navigating to another page, or after a section of the
+        page re-renders, so stale elements are not probed needlessly.
+
+        Args:
+            *locators (tuple): Locators whose cached elements to drop.
+                Every cached element is dropped when none are given.
+        """
+        if not locators:
+            cls._element_cache.clear()
+            return
+        for locator in locators:
+            cls._element_cache.pop(locator, None)
+
+    @classmethod
+    def wait_and_click(cls, locator, retries=2, parent_element=None,
+                       cached=False):
         """
         Waits for an element to become clickable, scrolls to it, and
         attempts to click it.
 
         This function waits until the specified element is clickable,
-        scrolls it into view using ActionChains, and performs a click.
+        scrolls it into view with `scrollIntoView`, and performs a click.
         If the click is intercepted (e.g., by overlays), it retries
         using JavaScript-based clicking. Retries are configurable.
 
@@ -114,6 +258,9 @@ class UIActions:
             click is intercepted. Defaults to 2.
             parent_element (WebElement, optional): Parent element to search
                             within. Defaults to None.
+            cached (bool, optional): Resolve the element through
+                            `find_cached`. Ignored when parent_element is
+                            given. Defaults to False.
 
         Returns:
             None
@@ -128,40 +275,59 @@ class UIActions:
             try:
                 if parent_element is not None:
                     # Scoped search inside the parent element
-                    element = WebDriverWait(
-                        driver, TIMEOUT).until(
+                    element = cls._get_wait().until(
                         lambda d: parent_element.find_element(by, value)
                     )
+                elif cached:
+                    element = cls.find_cached(locator)
                 else:
                     # Global search
-                    element = WebDriverWait(driver, TIMEOUT).until(
-                        EC.element_to_be_clickable(locator)
-                    )
+                    element = cls._get_wait().until(_clickable(locator))
 
-                # Scroll to element using ActionChains
-                ActionChains(driver).scroll_to_element(element).perform()
-                time.sleep(0.5)
+                # Scroll in the renderer; one command, no actions API tick
+                driver.execute_script(
+                    "arguments[0].scrollIntoView("
+                    "{block: 'center', inline: 'center'});", element)
 
                 element.click()
                 logger.debug("Clicked element: %s", locator)
                 return  # Success
 
+            except StaleElementReferenceException:
+                logger.debug("[Retry %s] Element went stale before click: %s",
+                             attempt + 1, locator)
+                cls._element_cache.pop(locator, None)
+
             except ElementClickInterceptedException:
                 logger.info(
                     "[Retry %s]Click intercepted, attempting JS click fallback", attempt + 1
                 )
                 try:
-                    driver.execute_script("arguments[0].click();", element)
+                    try:
+                        driver.execute_script("arguments[0].click();", element)
+                    except StaleElementReferenceException:
+                        # The overlay came from a re-render; click the new node
+                        scope = (
+                            parent_element
+                            if parent_element is not None
+                            else driver
+                        )
+                        element = scope.find_element(by, value)
+                        driver.execute_script("arguments[0].click();", element)
                     return
                 except Exception as js_error:
-                    print(f"JS click failed: {js_error}")
-                    time.sleep(1)
+                    logger.warning("JS click failed: %s", js_error)
+                    # Short, growing backoff with jitter; transient overlays
+                    # usually clear within a few tens of milliseconds
+                    time.sleep(min(
+                        0.05 * (2 ** attempt) + random.uniform(0, 0.05), 1.0))
 
         raise Exception(
             f"Failed to click element after {retries} attempts: {locator}")
 
     @classmethod
-    def wait_and_find_element(cls, locator, parent_element=None):
+    def wait_and_find_element(cls, locator, parent_element=None,
+                              clickable=True):
         """
         Waits for a web element to become clickable and returns it.
 
@@ -170,25 +336,33 @@ class UIActions:
         for ensuring that dynamic elements are interactable before performing
         actions.
 
+        Callers that only read the element or drive it through a script can
+        pass `clickable=False`. That waits for presence alone, which needs a
+        single lookup per poll instead of lookup, visibility and enabled
+        checks, and skips scrolling the element into view.
+
         Parameters:
             locator (tuple): A tuple specifying the strategy to locate the
                             element, e.g., (By.ID, "submit-button").
             parent_element (WebElement, optional): Parent element to search
                             within. Defaults to None.
+            clickable (bool, optional): Whether to wait for the element to
+                            be clickable rather than just present.
+                            Defaults to True.
         Returns:
-            WebElement: The Selenium WebElement once it becomes clickable.
+            WebElement: The Selenium WebElement once it becomes clickable,
+                            or present when `clickable` is False.
 
         Raises:
             TimeoutException: If the element does not become clickable within
                                 the timeout.
         """
-        driver = (
-            parent_element
-            if parent_element
-            else WebDriverManager.get_driver()
-        )
-        elem = WebDriverWait(driver, TIMEOUT).until(
-            EC.element_to_be_clickable(locator))
+        if not clickable:
+            elem = cls._get_wait(parent_element).until(_present(locator))
+            logger.debug("Element found: %s", locator)
+            return elem
+
+        elem = cls._get_wait(parent_element).until(_clickable(locator))
         logger.debug("Element found and clickable: %s", locator)
         # Scroll element into view
         cls.scroll_to_element(elem)
@@ -215,19 +389,87 @@ class UIActions:
         Raises:
             TimeoutException: If the elements are not found within the timeout.
         """
-        driver = (
-            parent_element
-            if parent_element
-            else WebDriverManager.get_driver()
-        )
+        return cls._get_wait(parent_element).until(_present_all(locator))
+
+    @classmethod
+    def wait_until(cls, condition, timeout=TIMEOUT,
+                   poll_frequency=POLL_FREQUENCY):
+        """
+        Waits until a condition is met on the current driver.
+
+        Thin wrapper over `WebDriverWait(driver, timeout).until(condition)`
+        so callers can replace fixed sleeps with an event they actually
+        depend on.
+
+        Args:
+            condition (Callable): An `expected_conditions` predicate or any
+                callable taking the driver and returning a truthy value.
+            timeout (float): Maximum time to wait in seconds.
+                Defaults to TIMEOUT.
+            poll_frequency (float): Seconds between checks. Defaults to
+                POLL_FREQUENCY; pass a larger value for conditions that
+                trigger network requests.
+
+        Returns:
+            Any: The truthy value returned by the condition.
+
+        Raises:
+            TimeoutException: If the condition is not met within the timeout.
+        """
+        if timeout == TIMEOUT and poll_frequency == POLL_FREQUENCY:
+            return cls._get_wait().until(condition)
+        driver = WebDriverManager.get_driver()
+        return WebDriverWait(
+            driver, timeout, poll_frequency=poll_frequency).until(condition)
+
+    @classmethod
+    def wait_for_locator_js(cls, locator, timeout=TIMEOUT):
+        """
+        Waits for an element matching the locator to be attached to the DOM.
+
+        Unlike WebDriverWait, which checks on a fixed interval, this installs
+        a MutationObserver in the page and returns as soon as a matching node
+        is inserted. It only checks presence; callers that need the element
+        clickable should still go through `wait_and_click`, which then
+        succeeds on its first check.
+
+        Args:
+            locator (tuple): An XPath, ID, class name, tag name or CSS
+                selector locator tuple.
+            timeout (float): Maximum time to wait in seconds.
+                Defaults to TIMEOUT.
+
+        Returns:
+            bool: True if the element appeared, False if the wait timed out
+                or the locator strategy is not supported.
+        """
+        by, value = locator
+        if by == By.XPATH:
+            xpath, css = value, None
+        elif by in _CSS_FORMATS:
+            xpath, css = None, _CSS_FORMATS[by].format(value)
+        else:
+            logger.debug("No JS wait for locator strategy: %s", by)
+            return False
 
-        elements = WebDriverWait(driver, TIMEOUT).until(
-            EC.presence_of_all_elements_located(locator)
-        )
-        return elements
+        driver = WebDriverManager.get_driver()
+        # The script timeout is session-wide; restore it for later callers
+        previous_timeout = driver.timeouts.script
+        driver.set_script_timeout(timeout + 1)
+        try:
+            found = driver.execute_async_script(
+                _WAIT_FOR_NODE_SCRIPT, xpath, css, int(timeout * 1000))
+        except TimeoutException:
+            found = False
+        finally:
+            driver.set_script_timeout(previous_timeout)
+        if not found:
+            logger.debug("Element not attached within %ss: %s",
+                         timeout, locator)
+        return bool(found)
 
     @classmethod
-    def wait_for_first_match(cls, locators, timeout=10):
+    def wait_for_first_match(cls, locators, timeout=10, poll_frequency=0.5):
         """
         Waits for the first matching element among multiple locators.
 
@@ -235,6 +477,8 @@ class UIActions:
             locators (dict): Dictionary with keys as labels and
                                 values as locator tuples.
             timeout (int): Maximum time to wait for any locator to appear.
+            poll_frequency (float): Seconds to sleep between polls.
+                                Defaults to 0.5.
 
         Returns:
             str: The key of the locator that appeared first, or
@@ -250,11 +494,11 @@ class UIActions:
                         return key
                 except (NoSuchElementException, StaleElementReferenceException):
                     continue
-            time.sleep(0.5)
+            time.sleep(poll_frequency)
         return "none"
 
     @classmethod
-    def fill_fields(cls, field_data):
+    def fill_fields(cls, field_data, cached=False, fast=False):
         """
         Fills multiple input fields based on provided (value, locator) pairs.
 
@@ -264,6 +508,12 @@ class UIActions:
             ):
                 A list of tuples containing input values and their
                 corresponding locators.
+            cached (bool, optional): Resolve the fields through
+                `find_cached`. Defaults to False.
+            fast (bool, optional): Set the values with `fast_type` instead
+                of typing them key by key. Only for plain inputs: masks,
+                datepickers and keyup validators never see the synthetic
+                events. Defaults to False.
 
         Raises:
             ValueError: If any input value is missing or locator is not found.
@@ -272,15 +522,43 @@ class UIActions:
             if not value:
                 raise ValueError(f"Missing input for locator: {locator}")
             try:
-                element = cls.wait_and_find_element(locator)
-                cls.clear_field(element)
-                element.send_keys(value)
+                element = (
+                    cls.find_cached(locator)
+                    if cached
+                    else cls.wait_and_find_element(locator)
+                )
+                if not fast or cls.fast_type(element, value) != value:
+                    # Typed key by key unless the fast path took the value
+                    cls.clear_field(element)
+                    element.send_keys(value)
                 logger.debug("Filled field %s with value: %s", locator, value)
                 cls.verify_field(value, element, locator, scroll=True)
             except Exception as e:
                 logger.error("Failed to fill field %s: %s", locator, e)
                 raise
 
+    @classmethod
+    def fast_type(cls, element, text):
+        """
+        Sets an input's value in a single script call.
+
+        `send_keys` sends a key event per character; this replaces the
+        value outright and dispatches the `input` and `change` events the
+        page listens for, so it also replaces any existing value. No key
+        events are fired, so use it only on fields known to be plain
+        inputs (see `fill_fields(fast=True)`).
+
+        Args:
+            element (selenium.webdriver.remote.webelement.WebElement):
+                The input element to fill.
+            text (str): The value to set.
+
+        Returns:
+            str: The element's value after the events were handled.
+        """
+        driver = WebDriverManager.get_driver()
+        return driver.execute_script(_SET_VALUE_SCRIPT, element, text)
+
     @classmethod
     def clear_field(cls, element):
         """
@@ -393,9 +671,10 @@ class UIActions:
         """
         Scrolls the specified web element into view and focuses it for interaction.
 
-        This function uses both JavaScript and ActionChains to ensure the element
-        is visible and centered in the viewport. It is especially useful for small
-        screens or scrollable containers.
+        A single script call centres the element with an instant
+        `scrollIntoView` and focuses it, so the element is in place as soon
+        as the call returns and no settle delay is needed. It is especially
+        useful for small screens or scrollable containers.
 
         Args:
             element (selenium.webdriver.remote.webelement.WebElement):
@@ -403,21 +682,12 @@ class UIActions:
         """
         driver = WebDriverManager.get_driver()
         try:
-            # JavaScript scroll (centered)
             driver.execute_script(
-                """
-                arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});
-            """,
+                "arguments[0].scrollIntoView("
+                "{block: 'center', inline: 'center'});"
+                "arguments[0].focus();",
                 element,
             )
-
-            # Focus the element
-            driver.execute_script("arguments[0].focus();", element)
-
-            # ActionChains scroll (fallback or reinforcement)
-            ActionChains(driver).scroll_to_element(element).perform()
-
-            time.sleep(0.2)  # Allow time for UI to settle
         except Exception as e:
             logger.warning("Scroll to element %s failed: %s", element, e)
 
@@ -20,7 +20,7 @@ Dependencies:
 Author: Ashish Namdev (ashish28 [at] sirt [dot] gmail [dot] com)
 
 Date Created:  2025-08-21
-Last Modified: 2025-10-03
+Last Modified: 2026-10-15
 
 Version: 1.0.0
 """
@@ -35,6 +35,9 @@ from common.logger import logger
 from utils.file_utils import backup_file
 from utils.labels import clean_column_labels
 
+# Honorifics stripped from names, e.g. "Mr. Ram" -> "Ram"
+_HONORIFIC_RE = re.compile(r"(?i)\b(?:mr|mrs)\b\.?\s*")
+
 
 def load_and_clean_excel(path):
     """
@@ -42,13 +45,18 @@ def load_and_clean_excel(path):
     - Converts all values to strings
     - Normalizes missing values to 'na'
     - Formats valid dates to 'DD/MM/YYYY'
+
+    Each column is factorized first, so every distinct value is cleaned
+    once and the result is broadcast back to its rows. Columns such as
+    class, section, gender or repeated dates have few distinct values, and
+    the per-value date parsing is the expensive part of the cleanup.
     """
     df = pd.read_excel(path)
 
-    def clean_cell(x, col):
+    def clean_cell(x, is_class_col):
         if pd.isna(x):
             return "na"
-        if "class" in col.lower():
+        if is_class_col:
             return str(x)
         if isinstance(x, pd.Timestamp):
             return x.strftime("%d/%m/%Y")
@@ -58,7 +66,7 @@ def load_and_clean_excel(path):
             return str(x)
         if isinstance(x, str):
             x = x.strip()
-            x = re.sub(r"(?i)\b(?:mr|mrs)\b\.?\s*", "", x).strip()
+            x = _HONORIFIC_RE.sub("", x).strip()
             if x.lower() in ["", "nan", "nat"]:
                 return "na"
             try:
@@ -69,7 +77,12 @@ def load_and_clean_excel(path):
         return str(x)
 
     for col in df.columns:
-        df[col] = df[col].apply(lambda x: clean_cell(x, col))
+        is_class_col = "class" in str(col).lower()
+        # Missing values get code -1, which picks the trailing "na"
+        codes, uniques = pd.factorize(df[col])
+        cleaned = [clean_cell(value, is_class_col) for value in uniques]
+        cleaned.append("na")
+        df[col] = [cleaned[code] for code in codes]
     return df
 
 
@@ -133,29 +146,17 @@ class StudentDataParser:
         # Ensure first column exists
         first_col = df.columns[0]
 
-        na_count = 1
-
-        # Build dictionary
-        parsed_data = {}
-        for _, row in df.iterrows():
-            main_key = str(row[first_col]).strip()
-
-            if main_key.strip().lower() == "na":
-                main_key = f"NA_{na_count}"
-                na_count += 1
-            # if not main_key:
-            #    continue  # Skip rows with empty first cell
-
-            # Create sub-dictionary excluding the first column
-            sub_dict = {}
-            for col in df.columns[1:]:  # Skip first column
-                value = row[col]
-                if isinstance(value, pd.Timestamp):
-                    sub_dict[col] = value.strftime("%Y-%m-%d")
-                else:
-                    sub_dict[col] = value
-
-            parsed_data[main_key] = sub_dict
+        # Row keys: first column, with "na" placeholders numbered NA_1, NA_2..
+        main_keys = df[first_col].astype(str).str.strip()
+        na_mask = main_keys.str.lower() == "na"
+        main_keys.loc[na_mask] = [
+            f"NA_{na_count}" for na_count in range(1, int(na_mask.sum()) + 1)
+        ]
+
+        # Build dictionary column-wise; every cell is already a cleaned
+        # string, so rows map straight to sub-dictionaries
+        records = df.drop(columns=first_col).to_dict(orient="records")
+        parsed_data = dict(zip(main_keys, records))
 
         self.parsed_data = parsed_data
         logger.debug("Data successfully parsed from %s",